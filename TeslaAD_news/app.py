@@ -7,8 +7,9 @@ from typing import Any, Dict, List
 
 import streamlit as st
 
-from src import config, feedback
-from src.pipeline import collect_news, write_news
+# Only what is needed to render a stored snapshot is imported up front; the
+# pipeline (requests, bs4, difflib, every source) loads in refresh_news().
+from src import config, feedback, render, storage
 
 
 st.set_page_config(
@@ -44,6 +45,13 @@ CARD_STYLE = """
   padding: 1.2rem;
   gap: 0.8rem;
 }
+.tesla-card-thumb {
+  width: 100%;
+  aspect-ratio: 16 / 9;
+  object-fit: cover;
+  border-radius: 10px;
+  background: rgba(240,246,252,0.04);
+}
 .tesla-card-content {
   display: flex;
   flex-direction: column;
@@ -91,17 +99,27 @@ CARD_STYLE = """
 
 
 def load_news() -> Dict[str, Any]:
-    if not config.DATA_FILE.exists():
-        items = collect_news()
-        return write_news(items)
-    try:
-        return json.loads(config.DATA_FILE.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
-        items = collect_news()
-        return write_news(items)
+    if config.DATA_FILE.exists():
+        try:
+            return json.loads(config.DATA_FILE.read_text(encoding="utf-8"))
+        except json.JSONDecodeError:
+            pass
+    snapshot = storage.read_snapshot()
+    if snapshot is not None:
+        return snapshot
+    return refresh_news()
+
+
+def refresh_news() -> Dict[str, Any]:
+    from src.models import RunReport
+    from src.pipeline import collect_news, write_news
+
+    report = RunReport()
+    items = collect_news(deadline=config.RUN_DEADLINE_SECONDS, report=report)
+    return write_news(items, report)
 
 
-def render_cards(items: List[Dict[str, Any]]) -> None:
+def render_cards(items: List[Dict[str, Any]], payload: Dict[str, Any]) -> None:
     st.markdown(CARD_STYLE, unsafe_allow_html=True)
     columns_per_row = 4
     cols = st.columns(columns_per_row)
@@ -111,27 +129,7 @@ def render_cards(items: List[Dict[str, Any]]) -> None:
             cols = st.columns(columns_per_row)
         col = cols[idx % columns_per_row]
         with col:
-            highlights = item.get("highlights") or []
-            if highlights:
-                bullet_html = "<ul>" + "".join(f"<li>{escape(point)}</li>" for point in highlights) + "</ul>"
-            else:
-                summary_text = escape(item.get("summary", ""))
-                bullet_html = f"<p>{summary_text}</p>" if summary_text else ""
-
-            card_html = f"""
-            <div class=\"tesla-card\">
-              <a href=\"{item['url']}\" target=\"_blank\" rel=\"noopener noreferrer\">
-                <div class=\"tesla-card-content\">
-                  <h3>{escape(item['title'])}</h3>
-                  {bullet_html}
-                  <div class=\"tesla-card-footer\">
-                    <span>{escape(item['source'])}</span>
-                    <span>{format_time(item['published_at'])}</span>
-                  </div>
-                </div>
-              </a>
-            </div>
-            """
+            card_html = render.card_html(item, payload)
             st.markdown(card_html, unsafe_allow_html=True)
 
             feedback_info = feedback.get_article_feedback(item["url"])
@@ -191,6 +189,14 @@ def render_cards(items: List[Dict[str, Any]]) -> None:
                 ):
                     if feedback_label != "Low relevance":
                         st.session_state[reason_key] = ""
+                    # Re-rank the page (and the stored candidate pool) against the
+                    # updated weights right away; a rejected card is replaced by the
+                    # next eligible candidate without a network refresh.
+                    from src import pool
+
+                    if pool.rerank() is not None:
+                        st.toast("Feedback saved. Ranking updated.", icon="?")
+                        st.rerun()
                     updated = feedback.get_article_feedback(item["url"])
                     current_label = updated.get("relevance")
                     current_reason = updated.get("reason")
@@ -203,16 +209,44 @@ def render_cards(items: List[Dict[str, Any]]) -> None:
                 st.caption(caption)
 
 
-def format_time(iso_str: str) -> str:
-    try:
-        dt = datetime.fromisoformat(iso_str)
-        if dt.tzinfo is None:
-            dt = config.KST.localize(dt)
-        else:
-            dt = dt.astimezone(config.KST)
-        return dt.strftime("%Y-%m-%d %H:%M")
-    except Exception:
-        return iso_str
+def render_archive_search() -> None:
+    with st.expander("Search archive"):
+        col_query, col_dates = st.columns([3, 2])
+        with col_query:
+            query = st.text_input("Keywords", key="archive_query", placeholder="예: 로보택시 FSD")
+        with col_dates:
+            date_range = st.date_input("Published between", value=(), key="archive_dates")
+
+        start = end = None
+        if isinstance(date_range, (list, tuple)):
+            if len(date_range) >= 1:
+                start = date_range[0]
+                end = date_range[-1]
+        elif date_range:
+            start = end = date_range
+
+        if not query.strip() and start is None:
+            st.caption("Enter keywords or pick a date range to search every collected article.")
+            return
+
+        try:
+            from src import archive
+
+            results = archive.search(query, start=start, end=end, limit=50)
+        except Exception as exc:
+            st.warning(f"Archive search failed: {exc}")
+            return
+
+        if not results:
+            st.info("No archived articles match the search.")
+            return
+
+        st.caption(f"{len(results)} result(s)")
+        for record in results:
+            st.markdown(
+                f"- [{escape(record['translated_title'] or record['title'])}]({record['url']}) "
+                f"· {escape(record['source'])} · {render.format_time(record['published_at'])}"
+            )
 
 
 def main() -> None:
@@ -220,24 +254,27 @@ def main() -> None:
     st.caption("Latest Tesla autonomous driving news, refreshed daily at 07:00 KST")
 
     data = load_news()
-    updated_at = format_time(data.get("updated_at", datetime.now(config.KST).isoformat()))
+    updated_at = data.get("updated_at_kst") or render.format_time(
+        data.get("updated_at", datetime.now(config.KST).isoformat())
+    )
 
     col1, col2 = st.columns([1, 5])
     with col1:
         if st.button("Refresh now", use_container_width=True):
             with st.spinner("Fetching the latest headlines..."):
-                items = collect_news()
-                data.update(write_news(items))
+                data.update(refresh_news())
                 st.rerun()
     with col2:
         st.markdown(f"**Last updated:** {updated_at}")
 
+    render_archive_search()
+
     items = data.get("items", [])
     if not items:
         st.info("No news to display. Please try again shortly.")
         return
 
-    render_cards(items)
+    render_cards(items, data)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,314 @@
+"""Microbenchmarks for the pure-Python hot paths of the pipeline.
+
+Runs each function over generated Korean/English headline corpora of
+increasing size and reports the best per-call time and the time per item.
+Results are written as sorted, rounded JSON so two runs diff cleanly, and are
+compared against a stored baseline; any benchmark slower than the baseline by
+more than ``--tolerance`` is reported as a regression (exit status 1).
+Calls faster than ``--min-gated-ms`` are reported but never gated: their
+ratio noise alone exceeds the tolerance.
+Every benchmark round is interleaved with a round of a fixed reference
+workload, and comparisons use the median ratio of adjacent rounds, which
+takes out most of the difference between machines and of CPU clock drift
+during a run.
+
+    python benchmarks/hot_functions.py
+    python benchmarks/hot_functions.py --only select_candidates deduplicate --sizes 10 100 1000
+    python benchmarks/hot_functions.py --save-baseline
+
+Baselines are machine specific; re-save one on the machine you compare on.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import timeit
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_DIR))
+
+from src import config, feedback, pipeline, utils  # noqa: E402
+from src.models import NewsItem  # noqa: E402
+from src.selection import CandidateSelector, get_item_datetime  # noqa: E402
+from src.sources.naver import parse_relative_time  # noqa: E402
+
+
+RESULTS_FILE = Path(__file__).resolve().parent / "hot_functions.results.json"
+BASELINE_FILE = Path(__file__).resolve().parent / "hot_functions.baseline.json"
+SIZES = (10, 100, 1000, 10000)
+SEED = 20240701
+CORPUS_NOW = datetime(2024, 7, 1, 9, 0, tzinfo=config.KST)
+
+EN_SUBJECTS = ["Tesla", "Elon Musk", "NHTSA", "Tesla's FSD v12", "The Robotaxi fleet", "Waymo and Tesla", "Tesla Autopilot"]
+EN_VERBS = ["expands", "launches", "pauses", "delays", "tests", "upgrades", "faces scrutiny over", "rolls out"]
+EN_OBJECTS = [
+    "Full Self-Driving beta",
+    "driverless robotaxi service",
+    "Autopilot recall",
+    "camera-only self-driving stack",
+    "end-to-end neural network planner",
+    "unsupervised FSD",
+    "Cybercab production",
+]
+EN_CONTEXTS = [
+    "in Austin",
+    "across Europe",
+    "after crash reports",
+    "ahead of quarterly earnings",
+    "as regulators weigh new rules",
+    "in China",
+    "for the 2025 Model Y",
+]
+KO_SUBJECTS = ["테슬라", "일론 머스크", "미 도로교통안전국", "테슬라 FSD", "로보택시", "국토부", "현대차와 테슬라"]
+KO_OBJECTS = ["완전자율주행", "로보택시 서비스", "오토파일럿 리콜", "자율주행 소프트웨어", "주행 보조 기능", "사이버캡 양산"]
+KO_VERBS = ["확대", "출시", "중단", "연기", "시험 운행", "업데이트", "조사 착수", "국내 도입"]
+KO_CONTEXTS = ["오스틴서", "유럽 전역에", "사고 보고 후", "실적 발표 앞두고", "규제 강화 속", "중국서", "내년 상반기"]
+RELATIVE_TIMES = ["3분 전", "17분 전", "2시간 전", "11시간 전", "1일 전", "3일 전", "어제", "2024.10.01.", "", "방금"]
+PRESS = ["연합뉴스", "한국경제", "조선비즈", "Reuters", "The Verge", "Electrek", "TechCrunch"]
+
+
+def make_corpus(size: int, seed: int = SEED) -> List[NewsItem]:
+    """``size`` news items, about half Korean, with realistic duplicate and near-duplicate rates."""
+    rng = random.Random(seed + size)
+    now = CORPUS_NOW
+    items: List[NewsItem] = []
+    for index in range(size):
+        roll = rng.random()
+        if items and roll < 0.08:
+            items.append(items[rng.randrange(len(items))])  # same URL from another feed
+            continue
+        if items and roll < 0.16:
+            base = items[rng.randrange(len(items))]
+            title = base.title.replace("테슬라", "美 테슬라") if base.language == "ko" else base.title + " - report"
+            items.append(_item(index, title, base.summary, base.language or "en", rng, now))
+            continue
+        if rng.random() < 0.5:
+            title = f"{rng.choice(KO_SUBJECTS)}, {rng.choice(KO_CONTEXTS)} {rng.choice(KO_OBJECTS)} {rng.choice(KO_VERBS)}"
+            summary = (
+                f"{title}. {rng.choice(KO_SUBJECTS)}는 {rng.choice(KO_OBJECTS)} 관련 계획을 밝혔다. "
+                f"업계는 {rng.choice(KO_OBJECTS)} 경쟁이 {rng.choice(KO_CONTEXTS)} 본격화할 것으로 본다 · "
+                f"{rng.choice(PRESS)} 보도, 주가 영향은 제한적"
+            )
+            items.append(_item(index, title, summary, "ko", rng, now))
+        else:
+            title = f"{rng.choice(EN_SUBJECTS)} {rng.choice(EN_VERBS)} {rng.choice(EN_OBJECTS)} {rng.choice(EN_CONTEXTS)}"
+            summary = (
+                f"{title}. The company said its {rng.choice(EN_OBJECTS)} would follow, "
+                f"while analysts questioned the timeline - {rng.choice(PRESS)} reports; shares moved little."
+            )
+            items.append(_item(index, title, summary, "en", rng, now))
+    return items
+
+
+def _item(index: int, title: str, summary: str, language: str, rng: random.Random, now: datetime) -> NewsItem:
+    published = now - timedelta(minutes=rng.randrange(0, 72 * 60))
+    style = rng.random()
+    if style < 0.6:
+        published_at = published.isoformat()
+    elif style < 0.9:
+        published_at = published.replace(tzinfo=None).isoformat()  # naive, localised as KST
+    else:
+        published_at = "unknown"
+    return NewsItem(
+        source=rng.choice(PRESS),
+        title=title,
+        summary=summary,
+        url=f"https://news.example.com/{language}/{index}",
+        published_at=published_at,
+        language=language,
+    )
+
+
+def install_feedback(items: Sequence[NewsItem], directory: Path) -> None:
+    """Point feedback at a synthetic, deterministic weight table so results do not drift with real feedback."""
+    rng = random.Random(SEED)
+    vocabulary = sorted({token for item in items for token in feedback.tokenize(f"{item.title} {item.summary}")})
+    weights = {token: round(rng.uniform(-3.0, 3.0), 2) for token in vocabulary if rng.random() < 0.4}
+    path = directory / "relevance.json"
+    path.write_text(json.dumps({"token_weights": weights}, ensure_ascii=False), encoding="utf-8")
+    config.FEEDBACK_FILE = path
+    feedback._CACHE = None
+
+
+@dataclass
+class Benchmark:
+    name: str
+    make: Callable[[List[NewsItem]], Callable[[], Any]]
+    max_size: Optional[int] = None  # quadratic benchmarks stop here unless sizes are given explicitly
+
+
+def _each(fn: Callable[[Any], Any], values: List[Any]) -> Callable[[], None]:
+    def run() -> None:
+        for value in values:
+            fn(value)
+
+    return run
+
+
+def _select_candidates(items: List[NewsItem]) -> Callable[[], None]:
+    # The selection stage as the pipeline runs it: one offer per scored item.
+    scored = [(item, float(index % 7)) for index, item in enumerate(items)]
+
+    def run() -> None:
+        selector = CandidateSelector(config.MAX_ITEMS, now=CORPUS_NOW, pool_limit=config.CANDIDATE_POOL_SIZE)
+        for item, score in scored:
+            selector.offer(item, score)
+        selector.results()
+
+    return run
+
+
+BENCHMARKS = [
+    Benchmark("build_highlights", lambda items: _each(pipeline.build_highlights, [item.summary for item in items])),
+    Benchmark("select_candidates", _select_candidates, max_size=1000),
+    Benchmark("deduplicate", lambda items: lambda: pipeline.deduplicate(items)),
+    Benchmark("get_item_datetime", lambda items: _each(get_item_datetime, items)),
+    Benchmark("tokenize", lambda items: _each(feedback.tokenize, [f"{item.title} {item.summary}" for item in items])),
+    Benchmark(
+        "score_article",
+        lambda items: _each(lambda item: feedback.score_article(item.title, item.summary), items),
+    ),
+    Benchmark(
+        "contains_any",
+        lambda items: _each(
+            lambda text: utils.contains_any(text, config.AUTONOMY_KEYWORDS),
+            [f"{item.title} {item.summary}" for item in items],
+        ),
+    ),
+    Benchmark(
+        "parse_relative_time",
+        lambda items: _each(parse_relative_time, [RELATIVE_TIMES[index % len(RELATIVE_TIMES)] for index in range(len(items))]),
+    ),
+]
+
+
+def measure(run: Callable[[], Any], repeat: int) -> Tuple[float, float]:
+    """Best seconds per call of ``run``, and its median ratio to the reference workload in adjacent rounds."""
+    timer = timeit.Timer(run)
+    reference = timeit.Timer(reference_workload)
+    number, _ = timer.autorange()
+    reference_number, _ = reference.autorange()
+    best = float("inf")
+    ratios: List[float] = []
+    for _ in range(repeat):
+        seconds = timer.timeit(number) / number
+        best = min(best, seconds)
+        ratios.append(seconds / (reference.timeit(reference_number) / reference_number))
+    return best, statistics.median(ratios)
+
+
+def reference_workload() -> None:
+    # Dict, string and regex-free loop work, roughly the mix of the functions above.
+    counts: Dict[str, int] = {}
+    for index in range(2000):
+        key = f"token{index % 97}"
+        counts[key] = counts.get(key, 0) + len(key.upper())
+    sorted(counts.items(), key=lambda pair: pair[1])
+
+
+def run(names: List[str], sizes: Sequence[int], repeat: int, explicit_sizes: bool) -> Dict[str, Dict[str, dict]]:
+    results: Dict[str, Dict[str, dict]] = {}
+    corpora = {size: make_corpus(size) for size in sizes}
+    with tempfile.TemporaryDirectory() as directory:
+        install_feedback(corpora[max(sizes)], Path(directory))
+        feedback.score_article("", "")  # load the weight table outside the timed loop
+        for benchmark in BENCHMARKS:
+            if benchmark.name not in names:
+                continue
+            results[benchmark.name] = {}
+            for size in sizes:
+                if benchmark.max_size and size > benchmark.max_size and not explicit_sizes:
+                    continue
+                seconds, relative = measure(benchmark.make(corpora[size]), repeat)
+                results[benchmark.name][str(size)] = {
+                    "per_call_ms": _round(seconds * 1e3),
+                    "per_item_us": _round(seconds * 1e6 / size),
+                    "relative": _round(relative),
+                }
+                print(f"{benchmark.name:<20} {size:>6}  {seconds * 1e3:10.3f} ms  {seconds * 1e6 / size:9.3f} us/item", flush=True)
+    return results
+
+
+def compare(
+    results: Dict[str, Dict[str, dict]],
+    baseline: Dict[str, Dict[str, dict]],
+    tolerance: float,
+    min_gated_ms: float,
+) -> int:
+    regressions = 0
+    print(f"\nAgainst baseline (tolerance {tolerance:.0%}, gating calls of {min_gated_ms:g} ms and up):")
+    for name, by_size in results.items():
+        for size, current in by_size.items():
+            previous = baseline.get(name, {}).get(size)
+            if not previous or not previous.get("relative"):
+                continue
+            ratio = current["relative"] / previous["relative"]
+            if ratio > 1 + tolerance and current["per_call_ms"] < min_gated_ms:
+                verdict = "slower (below gating threshold)"
+            elif ratio > 1 + tolerance:
+                verdict = "REGRESSION"
+                regressions += 1
+            elif ratio < 1 - tolerance:
+                verdict = "faster"
+            else:
+                verdict = ""
+            print(f"{name:<20} {size:>6}  x{ratio:5.2f}  {verdict}")
+    return regressions
+
+
+def _round(value: float) -> float:
+    return float(f"{value:.4g}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", nargs="+", choices=[benchmark.name for benchmark in BENCHMARKS])
+    parser.add_argument("--sizes", nargs="+", type=int, help=f"Corpus sizes (default {' '.join(map(str, SIZES))}).")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--output", type=Path, default=RESULTS_FILE)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE)
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the new baseline.")
+    parser.add_argument("--tolerance", type=float, default=0.3)
+    parser.add_argument(
+        "--min-gated-ms",
+        type=float,
+        default=1.0,
+        help="Only calls at least this slow can fail the run (default 1 ms).",
+    )
+    args = parser.parse_args()
+
+    names = args.only or [benchmark.name for benchmark in BENCHMARKS]
+    results = run(names, sorted(args.sizes or SIZES), args.repeat, explicit_sizes=bool(args.sizes))
+    document = {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "system": platform.system(),
+            "seed": SEED,
+        },
+        "results": results,
+    }
+    output = args.baseline if args.save_baseline else args.output
+    output.write_text(json.dumps(document, indent=2, sort_keys=True, ensure_ascii=False) + "\n", encoding="utf-8")
+    print(f"\nWrote {output}")
+    if args.save_baseline or not args.baseline.exists():
+        return 0
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    if baseline.get("meta", {}).get("python") != document["meta"]["python"]:
+        print(f"Baseline was recorded on Python {baseline.get('meta', {}).get('python')}; ratios are indicative only.")
+    return 1 if compare(results, baseline.get("results", {}), args.tolerance, args.min_gated_ms) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""Cold-start import cost of the Streamlit viewer path vs. the full pipeline.
+
+Runs ``python -X importtime`` in fresh interpreters and reports the
+cumulative import time of each target (best of ``--repeat`` runs), the
+slowest modules, and whether the viewer path pulled in any module that
+should only load on refresh.
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --targets viewer app --output importtime.json
+"""
+from __future__ import annotations
+
+import argparse
+import ast
+import json
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+
+
+def viewer_imports() -> str:
+    """app.py's module-level import statements, minus streamlit itself."""
+    tree = ast.parse((PROJECT_DIR / "app.py").read_text(encoding="utf-8"))
+    statements = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            node.names = [alias for alias in node.names if alias.name.split(".")[0] != "streamlit"]
+        elif isinstance(node, ast.ImportFrom):
+            if (node.module or "").split(".")[0] in ("streamlit", "__future__"):
+                continue
+        else:
+            continue
+        if node.names:
+            statements.append(ast.unparse(node))
+    return "; ".join(statements)
+
+
+TARGETS = {
+    "viewer": viewer_imports(),
+    "pipeline": "import src.pipeline",
+    # Needs streamlit installed; includes its own (large) import cost.
+    "app": "import app",
+}
+
+# Modules that must stay off the viewer path.
+HEAVY_MODULES = ("requests", "bs4", "difflib", "sqlite3", "src.pipeline", "src.archive")
+
+LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def measure(statement: str) -> Tuple[int, List[Tuple[str, int, int]]]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=PROJECT_DIR,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr else "import failed")
+
+    total = 0
+    modules: List[Tuple[str, int, int]] = []
+    for line in result.stderr.splitlines():
+        match = LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        modules.append((name, int(self_us), int(cumulative_us)))
+        if len(indent) == 1:  # top-level import
+            total += int(cumulative_us)
+    return total, modules
+
+
+def run(targets: List[str], repeat: int, top: int) -> Dict[str, dict]:
+    results: Dict[str, dict] = {}
+    for target in targets:
+        best_total = None
+        best_modules: List[Tuple[str, int, int]] = []
+        try:
+            for _ in range(repeat):
+                total, modules = measure(TARGETS[target])
+                if best_total is None or total < best_total:
+                    best_total, best_modules = total, modules
+        except RuntimeError as exc:
+            print(f"{target:<10} skipped ({exc})")
+            continue
+
+        loaded = {name for name, _, _ in best_modules}
+        heavy = sorted(name for name in HEAVY_MODULES if name in loaded)
+        slowest = sorted(best_modules, key=lambda entry: entry[1], reverse=True)[:top]
+        results[target] = {
+            "cumulative_ms": round(best_total / 1000, 2),
+            "modules": len(best_modules),
+            "heavy_modules": heavy,
+            "slowest": [{"module": name, "self_ms": round(self_us / 1000, 2)} for name, self_us, _ in slowest],
+        }
+
+        print(f"{target:<10} {best_total / 1000:8.1f} ms  {len(best_modules):4d} modules")
+        for name, self_us, _ in slowest:
+            print(f"    {self_us / 1000:7.1f} ms  {name}")
+        if heavy:
+            print(f"    heavy: {', '.join(heavy)}")
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--targets", nargs="+", choices=sorted(TARGETS), default=["viewer", "pipeline"])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8)
+    parser.add_argument("--output", type=Path, help="Write results as JSON to this file.")
+    args = parser.parse_args()
+
+    results = run(args.targets, args.repeat, args.top)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    viewer = results.get("viewer")
+    if viewer and viewer["heavy_modules"]:
+        print("Viewer path imports pipeline-only modules; keep them lazy in app.py.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,16 +1,87 @@
 from __future__ import annotations
 
+import argparse
 import logging
+from datetime import datetime
 
-from src import config
+from src import config, profiling
+from src.models import RunReport
 from src.pipeline import collect_news, write_news
 
 
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Collect Tesla autonomous driving news.")
+    parser.add_argument(
+        "--run-id",
+        default=datetime.now(config.KST).strftime("%Y%m%d"),
+        help="Checkpoint key; a retried run with the same id resumes from the last completed stage.",
+    )
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Discard existing checkpoints for the run id and start from scratch.",
+    )
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        default=config.RUN_DEADLINE_SECONDS,
+        help="Overall time budget in seconds; slow stages degrade instead of overrunning.",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=profiling.MODES,
+        help=f"Profile each pipeline stage into data/profiles/ (or set {profiling.PROFILE_ENV}).",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Fetch, filter and select in one bounded-memory streaming pass (for large source lists).",
+    )
+    parser.add_argument(
+        "--rerank",
+        action="store_true",
+        help="Only re-rank the current snapshot and candidate pool against the latest feedback weights.",
+    )
+    return parser.parse_args()
+
+
 def main() -> None:
+    args = parse_args()
     logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
-    items = collect_news()
-    payload = write_news(items)
+    if args.rerank:
+        from src import pool
+
+        payload = pool.rerank()
+        if payload is None:
+            logging.warning("No snapshot to re-rank at %s", config.DATA_FILE)
+        else:
+            logging.info("Re-ranked %d items in %s", len(payload["items"]), config.DATA_FILE)
+        return
+
+    if args.profile:
+        profiling.start(args.profile)
+    else:
+        profiling.start_from_env()
+
+    report = RunReport()
+    items = collect_news(
+        run_id=args.run_id,
+        resume=not args.fresh,
+        deadline=args.deadline,
+        report=report,
+        streaming=args.stream,
+    )
+    with profiling.stage("write"):
+        payload = write_news(items, report)
     logging.info("Stored %d items to %s", len(payload["items"]), config.DATA_FILE)
+    if report.skipped_sources:
+        logging.info(
+            "Skipped low-yield sources %s (~%.1f s saved)",
+            ", ".join(report.skipped_sources),
+            report.estimated_seconds_saved,
+        )
+    for degradation in report.degradations:
+        logging.warning("Degraded %(stage)s: %(action)s (%(count)d)", degradation)
 
 
 if __name__ == "__main__":
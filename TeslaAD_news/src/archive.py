@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import sqlite3
+from contextlib import closing
+from datetime import date, datetime, time, timedelta
+from typing import Iterable, List, Optional
+
+from . import config
+from .models import NewsItem
+
+
+# The trigram tokenizer indexes every 3-character window, which suits Korean
+# where particles are glued onto nouns and whitespace tokenizing misses
+# "자율주행은" when searching for "자율주행". Shorter terms fall back to LIKE.
+MIN_FTS_TERM = 3
+# Version 2 keeps translations next to the original text instead of over it.
+SCHEMA_VERSION = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    url TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    title TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    highlights TEXT NOT NULL DEFAULT '',
+    image_url TEXT,
+    language TEXT,
+    published_at TEXT NOT NULL,
+    published_ts INTEGER NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    selected INTEGER NOT NULL DEFAULT 0,
+    translated_title TEXT,
+    translated_summary TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_items_source ON items(source, published_ts);
+CREATE INDEX IF NOT EXISTS idx_items_published ON items(published_ts);
+CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5(
+    title, summary, highlights, translated_title, translated_summary,
+    content='items', content_rowid='rowid', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS items_ai AFTER INSERT ON items BEGIN
+    INSERT INTO items_fts(rowid, title, summary, highlights, translated_title, translated_summary)
+    VALUES (new.rowid, new.title, new.summary, new.highlights, new.translated_title, new.translated_summary);
+END;
+CREATE TRIGGER IF NOT EXISTS items_ad AFTER DELETE ON items BEGIN
+    INSERT INTO items_fts(items_fts, rowid, title, summary, highlights, translated_title, translated_summary)
+    VALUES ('delete', old.rowid, old.title, old.summary, old.highlights, old.translated_title, old.translated_summary);
+END;
+CREATE TRIGGER IF NOT EXISTS items_au AFTER UPDATE ON items BEGIN
+    INSERT INTO items_fts(items_fts, rowid, title, summary, highlights, translated_title, translated_summary)
+    VALUES ('delete', old.rowid, old.title, old.summary, old.highlights, old.translated_title, old.translated_summary);
+    INSERT INTO items_fts(rowid, title, summary, highlights, translated_title, translated_summary)
+    VALUES (new.rowid, new.title, new.summary, new.highlights, new.translated_title, new.translated_summary);
+END;
+"""
+
+# Version 1 archives: add the translation columns and rebuild the index with them.
+MIGRATE_V1 = """
+ALTER TABLE items ADD COLUMN translated_title TEXT;
+ALTER TABLE items ADD COLUMN translated_summary TEXT;
+DROP TRIGGER IF EXISTS items_ai;
+DROP TRIGGER IF EXISTS items_ad;
+DROP TRIGGER IF EXISTS items_au;
+DROP TABLE IF EXISTS items_fts;
+"""
+
+UPSERT = """
+INSERT INTO items (
+    url, source, title, summary, highlights, image_url, language,
+    published_at, published_ts, first_seen, last_seen, selected
+) VALUES (
+    :url, :source, :title, :summary, :highlights, :image_url, :language,
+    :published_at, :published_ts, :seen, :seen, :selected
+)
+ON CONFLICT(url) DO UPDATE SET
+    source = excluded.source,
+    title = excluded.title,
+    summary = excluded.summary,
+    highlights = CASE WHEN excluded.highlights != '' THEN excluded.highlights ELSE items.highlights END,
+    image_url = COALESCE(excluded.image_url, items.image_url),
+    language = excluded.language,
+    published_at = excluded.published_at,
+    published_ts = excluded.published_ts,
+    last_seen = excluded.last_seen,
+    selected = MAX(items.selected, excluded.selected)
+"""
+
+# Translated copies of items: fill in the translation columns and leave the
+# original text, source and language alone. A row seen for the first time
+# (normally archived untranslated before) falls back to the translation.
+UPSERT_TRANSLATED = """
+INSERT INTO items (
+    url, source, title, summary, highlights, image_url, language,
+    published_at, published_ts, first_seen, last_seen, selected,
+    translated_title, translated_summary
+) VALUES (
+    :url, :source, :title, :summary, :highlights, :image_url, :language,
+    :published_at, :published_ts, :seen, :seen, :selected,
+    :title, :summary
+)
+ON CONFLICT(url) DO UPDATE SET
+    translated_title = excluded.translated_title,
+    translated_summary = excluded.translated_summary,
+    highlights = CASE WHEN excluded.highlights != '' THEN excluded.highlights ELSE items.highlights END,
+    image_url = COALESCE(excluded.image_url, items.image_url),
+    last_seen = excluded.last_seen,
+    selected = MAX(items.selected, excluded.selected)
+"""
+
+COLUMNS = (
+    "url",
+    "source",
+    "title",
+    "summary",
+    "highlights",
+    "image_url",
+    "language",
+    "published_at",
+    "selected",
+    "translated_title",
+    "translated_summary",
+)
+
+
+def connect() -> sqlite3.Connection:
+    config.ARCHIVE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(config.ARCHIVE_FILE)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version < SCHEMA_VERSION:
+        outdated = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'items'").fetchone()
+        with conn:
+            if outdated:
+                conn.executescript(MIGRATE_V1)
+            conn.executescript(SCHEMA)
+            if outdated:
+                conn.execute("INSERT INTO items_fts(items_fts) VALUES ('rebuild')")
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    else:
+        conn.executescript(SCHEMA)
+    return conn
+
+
+def upsert_items(items: Iterable[NewsItem], selected: bool = False, translated: bool = False) -> int:
+    """Archive ``items``; with ``translated`` they are translations of items archived before."""
+    seen = datetime.now(config.KST).isoformat()
+    rows = [
+        {
+            "url": item.url or item.title,
+            "source": item.source,
+            "title": item.title,
+            "summary": item.summary,
+            "highlights": "\n".join(item.highlights or []),
+            "image_url": item.image_url,
+            "language": item.language,
+            "published_at": item.published_at,
+            "published_ts": _timestamp(item.published_at),
+            "seen": seen,
+            "selected": int(selected),
+        }
+        for item in items
+    ]
+    if not rows:
+        return 0
+    with closing(connect()) as conn, conn:
+        conn.executemany(UPSERT_TRANSLATED if translated else UPSERT, rows)
+    return len(rows)
+
+
+def search(
+    query: str = "",
+    start: date | None = None,
+    end: date | None = None,
+    source: str | None = None,
+    limit: int = 50,
+) -> List[dict]:
+    """Search archived items, newest first.
+
+    ``start`` and ``end`` are inclusive KST calendar days.
+    """
+    clauses: List[str] = []
+    params: List[object] = []
+
+    terms = [term.replace('"', "") for term in query.split()]
+    terms = [term for term in terms if term]
+    fts_terms = [term for term in terms if len(term) >= MIN_FTS_TERM]
+    if fts_terms:
+        clauses.append("items.rowid IN (SELECT rowid FROM items_fts WHERE items_fts MATCH ?)")
+        params.append(" ".join(f'"{term}"' for term in fts_terms))
+    for term in terms:
+        if len(term) < MIN_FTS_TERM:
+            clauses.append(
+                "(items.title LIKE ? OR items.summary LIKE ? OR items.highlights LIKE ?"
+                " OR items.translated_title LIKE ? OR items.translated_summary LIKE ?)"
+            )
+            params.extend([f"%{term}%"] * 5)
+
+    if start is not None:
+        clauses.append("items.published_ts >= ?")
+        params.append(_day_start(start))
+    if end is not None:
+        clauses.append("items.published_ts < ?")
+        params.append(_day_start(end + timedelta(days=1)))
+    if source:
+        clauses.append("items.source = ?")
+        params.append(source)
+
+    sql = f"SELECT {', '.join(COLUMNS)} FROM items"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    sql += " ORDER BY items.published_ts DESC LIMIT ?"
+    params.append(limit)
+
+    with closing(connect()) as conn:
+        rows = conn.execute(sql, params).fetchall()
+    results = []
+    for row in rows:
+        record = dict(row)
+        record["highlights"] = [line for line in record["highlights"].split("\n") if line]
+        results.append(record)
+    return results
+
+
+def _timestamp(value: Optional[str]) -> int:
+    try:
+        dt = datetime.fromisoformat(value) if value else datetime.now(config.KST)
+    except ValueError:
+        dt = datetime.now(config.KST)
+    if dt.tzinfo is None:
+        dt = config.KST.localize(dt)
+    return int(dt.timestamp())
+
+
+def _day_start(day: date) -> int:
+    return int(config.KST.localize(datetime.combine(day, time.min)).timestamp())
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import time
+from typing import Optional
+
+from . import config
+
+
+class Deadline:
+    """Monotonic wall-clock budget. ``Deadline(None)`` never expires."""
+
+    def __init__(self, seconds: Optional[float] = None) -> None:
+        self.expires_at = None if seconds is None else time.monotonic() + max(seconds, 0.0)
+
+    def remaining(self) -> Optional[float]:
+        if self.expires_at is None:
+            return None
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    def expired(self) -> bool:
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0.0
+
+    def timeout(self, default: float) -> float:
+        """Per-request timeout that never outlives the deadline."""
+        remaining = self.remaining()
+        if remaining is None:
+            return default
+        return max(min(default, remaining), 0.1)
+
+    def for_stage(self, stage: str) -> "Deadline":
+        """Carve ``stage``'s share out of what is left of this deadline.
+
+        Shares are taken relative to the stages still to run (plus the reserve
+        kept back for writing the snapshot), so time an earlier stage did not
+        use rolls over to the later ones.
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return Deadline(None)
+        stages = list(config.STAGE_BUDGET_SHARES)
+        pending = stages[stages.index(stage):]
+        total = sum(config.STAGE_BUDGET_SHARES[name] for name in pending) + config.WRITE_BUDGET_SHARE
+        share = config.STAGE_BUDGET_SHARES[stage] / total if total else 1.0
+        return Deadline(remaining * share)
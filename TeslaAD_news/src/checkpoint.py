@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import shutil
+import time
+from dataclasses import asdict, is_dataclass
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+from . import config, profiling, storage
+from .models import NewsItem
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def fingerprint(value: Any) -> str:
+    encoded = json.dumps(value, ensure_ascii=False, sort_keys=True, default=_jsonable)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def encode_items(items: List[NewsItem]) -> list:
+    return [asdict(item) for item in items]
+
+
+def decode_items(raw: list) -> List[NewsItem]:
+    return [NewsItem(**entry) for entry in raw]
+
+
+class Run:
+    """Per-stage checkpoints for one pipeline run.
+
+    Each stage stores its output together with a fingerprint of its inputs.
+    A retried run with the same ``run_id`` reuses a stage's stored output as
+    long as the fingerprint still matches, so only the stage that failed (and
+    anything downstream of it) is recomputed. Without a ``run_id`` every stage
+    simply runs.
+    """
+
+    def __init__(self, run_id: Optional[str] = None, resume: bool = True) -> None:
+        self.run_id = run_id
+        self.resume = resume
+        self.directory = config.CHECKPOINT_DIR / run_id if run_id else None
+        self.resumed: List[str] = []
+        self.timings: Dict[str, float] = {}
+        if self.directory is not None:
+            _prune_stale_runs(keep=self.directory.name)
+            if not resume:
+                shutil.rmtree(self.directory, ignore_errors=True)
+
+    def stage(
+        self,
+        name: str,
+        inputs: Any,
+        compute: Callable[[], T],
+        encode: Callable[[T], Any] = encode_items,
+        decode: Callable[[Any], T] = decode_items,
+    ) -> T:
+        started = time.perf_counter()
+        try:
+            with profiling.stage(name):
+                return self._run_stage(name, inputs, compute, encode, decode)
+        finally:
+            self.timings[name] = round(time.perf_counter() - started, 3)
+
+    def _run_stage(
+        self,
+        name: str,
+        inputs: Any,
+        compute: Callable[[], T],
+        encode: Callable[[T], Any],
+        decode: Callable[[Any], T],
+    ) -> T:
+        if self.directory is None:
+            return compute()
+
+        input_hash = fingerprint(inputs)
+        path = self.directory / f"{name}.json"
+        if self.resume and path.exists():
+            try:
+                stored = storage.read_json(path)
+                if stored.get("input_hash") == input_hash:
+                    logger.info("Resuming stage %s from checkpoint %s", name, self.run_id)
+                    self.resumed.append(name)
+                    return decode(stored["output"])
+            except (OSError, ValueError, KeyError, TypeError) as exc:
+                logger.warning("Ignoring unreadable checkpoint %s: %s", path, exc)
+
+        output = compute()
+        try:
+            storage.atomic_write_json(
+                path,
+                {"stage": name, "input_hash": input_hash, "output": encode(output)},
+                encoding="compact",
+            )
+        except OSError as exc:
+            logger.warning("Failed to checkpoint stage %s: %s", name, exc)
+        return output
+
+    def complete(self) -> None:
+        """Drop the run's checkpoints once the pipeline has finished."""
+        if self.directory is not None:
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+
+def _prune_stale_runs(keep: str) -> None:
+    if not config.CHECKPOINT_DIR.exists():
+        return
+    cutoff = time.time() - config.CHECKPOINT_TTL_HOURS * 3600
+    for run_dir in config.CHECKPOINT_DIR.iterdir():
+        if run_dir.name == keep or not run_dir.is_dir():
+            continue
+        try:
+            if run_dir.stat().st_mtime < cutoff:
+                shutil.rmtree(run_dir, ignore_errors=True)
+        except OSError:
+            continue
+
+
+def _jsonable(value: Any) -> Any:
+    if is_dataclass(value):
+        return asdict(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    return str(value)
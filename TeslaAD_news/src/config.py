@@ -11,6 +11,49 @@ DATA_FILE = DATA_DIR / "news.json"
 IMAGE_CACHE_FILE = DATA_DIR / "image_cache.json"
 ARTICLE_CACHE_FILE = IMAGE_CACHE_FILE  # backwards compatibility for cache
 FEEDBACK_FILE = BASE_DIR / "feedback" / "relevance.json"
+SNAPSHOT_DIR = DATA_DIR / "snapshots"
+SNAPSHOT_LATEST_FILE = SNAPSHOT_DIR / "LATEST"
+SNAPSHOT_ENCODING = "gzip"  # json | compact | gzip
+SNAPSHOT_RETENTION = 30
+ARCHIVE_FILE = DATA_DIR / "archive.sqlite3"
+CHECKPOINT_DIR = DATA_DIR / "checkpoints"
+CHECKPOINT_TTL_HOURS = 48
+PROFILE_DIR = DATA_DIR / "profiles"
+CANDIDATE_POOL_FILE = DATA_DIR / "candidates.json"
+SOURCE_STATS_FILE = DATA_DIR / "source_stats.json"
+SOURCE_EWMA_ALPHA = 0.3
+SOURCE_MIN_RUNS = 5  # runs of history before a source can be judged low yield
+SOURCE_LOW_YIELD = 0.5  # average surviving unique items per run
+SOURCE_PROBE_EVERY = 4  # a skipped source is still fetched every N runs
+SOURCE_CONCURRENCY = 4  # fetches in flight in streaming mode
+STREAM_SEEN_KEYS = 20000  # recent URLs remembered for streaming dedupe
+STREAM_ARCHIVE_BATCH = 200
+X_STATE_FILE = DATA_DIR / "x_state.json"
+X_CACHE_TTL_SECONDS = 900  # reuse of the r.jina.ai/Nitter response
+X_SEEN_LIMIT = 2000  # post fingerprints remembered between runs
+X_KEPT_POSTS = 20
+# Streamlit serves static files only from static/ next to app.py
+# (server.enableStaticServing in .streamlit/config.toml).
+THUMBNAIL_DIR = BASE_DIR / "static" / "thumbnails"
+THUMBNAIL_URL_PREFIX = "app/static/thumbnails"
+THUMBNAIL_INDEX_FILE = DATA_DIR / "thumbnails.json"
+THUMBNAIL_WIDTHS = (320, 640)  # card width at 1x and 2x
+THUMBNAIL_QUALITY = 75
+THUMBNAIL_MAX_SOURCE_BYTES = 10 * 1024 * 1024
+THUMBNAIL_RETENTION_DAYS = 30
+CANDIDATE_POOL_SIZE = 48
+CANDIDATE_RESERVE = 4  # pool candidates enriched and translated ahead of time
+
+RUN_DEADLINE_SECONDS = 180
+# Relative shares of the run deadline; whatever a stage leaves unused rolls
+# over to the stages after it. WRITE_BUDGET_SHARE is held back for the snapshot.
+STAGE_BUDGET_SHARES = {
+    "sources": 0.4,
+    "enrichment": 0.35,
+    "thumbnails": 0.1,
+    "translation": 0.2,
+}
+WRITE_BUDGET_SHARE = 0.05
 
 KST = pytz.timezone("Asia/Seoul")
 MAX_ITEMS = 12
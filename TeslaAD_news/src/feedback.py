@@ -4,7 +4,7 @@ import json
 import logging
 import re
 from collections import Counter
-from datetime import datetime
+from datetime import date, datetime
 from typing import Dict
 
 from . import config
@@ -29,12 +29,33 @@ STATUS_WEIGHTS = {
 WEIGHT_CLAMP = 10.0
 HISTORY_LIMIT = 200
 
+# Token weights halve every WEIGHT_HALF_LIFE_DAYS without new feedback.
+# Decay is applied in whole days, so the file is rewritten at most once a day
+# outside of explicit feedback.
+WEIGHT_HALF_LIFE_DAYS = 45.0
+PRUNE_EPSILON = 0.05  # |weight| below this carries no ranking signal
+STALE_TOKEN_DAYS = 90  # tokens seen only once and untouched this long are dropped
+MAX_TOKENS = 5000  # hard cap on the vocabulary; weakest weights are evicted first
+
 _CACHE: dict | None = None
 
 
 def _normalise(data: dict) -> dict:
     if not isinstance(data.get("token_weights"), dict):
         data["token_weights"] = {}
+    if not isinstance(data.get("token_meta"), dict):
+        data["token_meta"] = {}
+    today = date.today().toordinal()
+    if not isinstance(data.get("decayed_on"), int):
+        data["decayed_on"] = today
+    meta = data["token_meta"]
+    for token in data["token_weights"]:
+        entry = meta.get(token)
+        if not (isinstance(entry, list) and len(entry) == 2):
+            # [times seen in rated articles, ordinal day of the last update]
+            meta[token] = [1, data["decayed_on"]]
+    for token in [token for token in meta if token not in data["token_weights"]]:
+        del meta[token]
     if not isinstance(data.get("article_feedback"), dict):
         data["article_feedback"] = {}
     else:
@@ -80,6 +101,8 @@ def _ensure_loaded() -> dict:
         _CACHE = json.loads(raw_text)
 
     _CACHE = _normalise(_CACHE)
+    if _maintain(_CACHE, date.today().toordinal()):
+        _CACHE["updated_at"] = datetime.now(config.KST).isoformat()
     serialised = json.dumps(_CACHE, ensure_ascii=False, indent=2)
     if raw_text is None or raw_text != serialised:
         path.write_text(serialised, encoding="utf-8")
@@ -93,6 +116,10 @@ def _save() -> None:
     config.FEEDBACK_FILE.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
 
 
+def get_updated_at() -> str | None:
+    return _ensure_loaded().get("updated_at")
+
+
 def tokenize(text: str) -> Counter:
     words = TOKEN_PATTERN.findall(text.lower())
     return Counter(words)
@@ -145,8 +172,13 @@ def record_feedback(url: str, title: str, summary: str, label: str | None, reaso
         if abs(delta) > 0.0:
             tokens = tokenize(f"{title} {summary}")
             weights: Dict[str, float] = data["token_weights"]
+            meta: Dict[str, list] = data["token_meta"]
+            today = date.today().toordinal()
             for token, count in tokens.items():
                 weights[token] = _clamp(weights.get(token, 0.0) + delta * count)
+                seen = meta.get(token, [0, today])[0]
+                meta[token] = [seen + 1, today]
+            _maintain(data, today)
 
     data["article_feedback"][url] = {
         "status": status,
@@ -177,6 +209,37 @@ def score_article(title: str, summary: str) -> float:
     return sum(weights.get(token, 0.0) * count for token, count in tokens.items())
 
 
+def _maintain(data: dict, today: int) -> bool:
+    """Decay, prune and cap the token table in place. Returns True if anything changed."""
+    weights: Dict[str, float] = data["token_weights"]
+    meta: Dict[str, list] = data["token_meta"]
+    changed = False
+
+    elapsed = today - data["decayed_on"]
+    if elapsed > 0:
+        factor = 0.5 ** (elapsed / WEIGHT_HALF_LIFE_DAYS)
+        for token, value in weights.items():
+            weights[token] = round(value * factor, 4)
+        data["decayed_on"] = today
+        changed = True
+
+    stale_before = today - STALE_TOKEN_DAYS
+    doomed = [
+        token
+        for token, value in weights.items()
+        if abs(value) < PRUNE_EPSILON or (meta[token][0] <= 1 and meta[token][1] < stale_before)
+    ]
+    if len(weights) - len(doomed) > MAX_TOKENS:
+        keep = set(weights).difference(doomed)
+        # Evict the weakest signals first, the least recently updated among equals.
+        ranked = sorted(keep, key=lambda token: (abs(weights[token]), meta[token][1]))
+        doomed.extend(ranked[: len(keep) - MAX_TOKENS])
+    for token in doomed:
+        del weights[token]
+        del meta[token]
+    return changed or bool(doomed)
+
+
 def _clamp(value: float) -> float:
     if value > WEIGHT_CLAMP:
         return WEIGHT_CLAMP
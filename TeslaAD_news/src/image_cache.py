@@ -4,6 +4,7 @@ from __future__ import annotations
 import json
 import logging
 import re
+from datetime import datetime
 from html import unescape
 from typing import Any, List, Optional
 from urllib.parse import urljoin
@@ -18,6 +19,7 @@ logger = logging.getLogger(__name__)
 _cache: dict[str, dict[str, Any]] = {}
 _dirty = False
 _loaded = False
+ARTICLE_TIMEOUT = 15.0
 TARGET_REGEX = re.compile(r"\"(?:targetUrl|canonicalUrl)\"\s*:\s*\"([^\"]+)\"")
 
 
@@ -49,18 +51,28 @@ def persist_cache() -> None:
         _dirty = False
 
 
-def resolve_article_data(url: str) -> dict[str, Any]:
+def resolve_article_data(url: str, timeout: float = ARTICLE_TIMEOUT) -> dict[str, Any]:
+    """Image and highlights of the article at ``url``, fetched on first use.
+
+    A failed fetch is retried at most once a day, and not remembered at all
+    when the run's deadline had cut ``timeout`` short.
+    """
     global _dirty
     _load_cache()
-    if url in _cache:
-        entry = _cache[url]
-        if isinstance(entry, str):
-            entry = {"image": entry, "highlights": []}
-            _cache[url] = entry
-            _dirty = True
+    today = datetime.now(config.KST).date().isoformat()
+    entry = _cache.get(url)
+    if isinstance(entry, str):
+        entry = {"image": entry, "highlights": []}
+        _cache[url] = entry
+        _dirty = True
+    if entry is not None and entry.get("failed") in (None, today):
         return entry
 
-    data = _fetch_article_data(url)
+    data = _fetch_article_data(url, timeout=timeout)
+    if data is None:
+        if timeout < ARTICLE_TIMEOUT:
+            return {"image": None, "highlights": []}
+        data = {"image": None, "highlights": [], "failed": today}
     _cache[url] = data
     _dirty = True
     return data
@@ -70,17 +82,18 @@ def resolve_image(url: str) -> Optional[str]:
     return resolve_article_data(url).get("image")
 
 
-def _fetch_article_data(url: str, depth: int = 0) -> dict[str, Any]:
+def _fetch_article_data(url: str, depth: int = 0, timeout: float = ARTICLE_TIMEOUT) -> Optional[dict[str, Any]]:
+    """None when ``url`` itself could not be fetched."""
     data: dict[str, Any] = {"image": None, "highlights": []}
     if depth > 2:
         return data
 
     try:
-        response = requests.get(url, headers={"User-Agent": config.USER_AGENT}, timeout=15)
+        response = requests.get(url, headers={"User-Agent": config.USER_AGENT}, timeout=timeout)
         response.raise_for_status()
     except Exception as exc:
         logger.debug("Failed to fetch article (%s): %s", url, exc)
-        return data
+        return None
 
     soup = BeautifulSoup(response.text, "html.parser")
     final_url = response.url
@@ -91,7 +104,7 @@ def _fetch_article_data(url: str, depth: int = 0) -> dict[str, Any]:
     if not image or len(highlights) < 2:
         target_url = _extract_target_url(response.text, soup) or final_url
         if target_url != final_url:
-            nested = _fetch_article_data(target_url, depth + 1)
+            nested = _fetch_article_data(target_url, depth + 1, timeout) or data
             image = image or nested.get("image")
             if len(highlights) < len(nested.get("highlights", [])):
                 highlights = nested.get("highlights", highlights)
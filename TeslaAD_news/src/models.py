@@ -1,4 +1,5 @@
 ﻿from dataclasses import dataclass, field
+from typing import Any
 
 
 @dataclass
@@ -11,3 +12,29 @@ class NewsItem:
     image_url: str | None = field(default=None)
     language: str | None = field(default=None)
     highlights: list[str] | None = field(default=None)
+    thumbnails: dict[str, str] | None = field(default=None)  # width -> file in THUMBNAIL_DIR
+
+
+@dataclass
+class RunReport:
+    run_id: str | None = field(default=None)
+    deadline_seconds: float | None = field(default=None)
+    stage_seconds: dict[str, float] = field(default_factory=dict)
+    resumed_stages: list[str] = field(default_factory=list)
+    degradations: list[dict[str, Any]] = field(default_factory=list)
+    sources: dict[str, dict[str, float]] = field(default_factory=dict)
+    skipped_sources: list[str] = field(default_factory=list)
+    estimated_seconds_saved: float = field(default=0.0)
+
+    def degrade(self, stage: str, action: str, count: int) -> None:
+        if count:
+            self.degradations.append({"stage": stage, "action": action, "count": count})
+
+
+@dataclass
+class Candidate:
+    item: NewsItem
+    score: float
+    tier: int
+    ready: bool = field(default=False)
+    text: str = field(default="")  # original "title summary", before translation
@@ -1,19 +1,25 @@
 from __future__ import annotations
 
-import json
 import logging
 import re
+import sqlite3
+import time
 from collections import OrderedDict
-from dataclasses import asdict
-from datetime import datetime, timedelta
-from difflib import SequenceMatcher
-from typing import Iterable, List
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, replace
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Tuple
 from urllib.parse import quote_plus
 
-from . import config, feedback, image_cache
-from .models import NewsItem
+from . import archive, checkpoint, config, feedback, image_cache, pool, render, storage, thumbnails
+from .budget import Deadline
+from .models import Candidate, NewsItem, RunReport
+from .scheduler import Source, SourceScheduler, build_sources
+from .selection import CandidateSelector
+from .similarity import is_similar
 from .sources.google import fetch_google_news
 from .sources.naver import fetch_naver_news
+from .sources.x import X_QUERY, fetch_x_snippets
 from .utils import is_autonomy_related, translate_to_korean
 
 
@@ -22,20 +28,18 @@ logger = logging.getLogger(__name__)
 SPLIT_SENTENCES = re.compile(r"(?<=[.!?])\s+|(?:\n|\r)+|-+")
 SPLIT_PHRASES = re.compile(r"[,;]")
 
-
-def get_item_datetime(item: NewsItem) -> datetime:
-    try:
-        dt = datetime.fromisoformat(item.published_at)
-        if dt.tzinfo is None:
-            return config.KST.localize(dt)
-        return dt.astimezone(config.KST)
-    except Exception:
-        return datetime.now(config.KST)
-
-
-def filter_recent(items: Iterable[NewsItem], hours: int) -> List[NewsItem]:
-    cutoff = datetime.now(config.KST) - timedelta(hours=hours)
-    return [item for item in items if get_item_datetime(item) >= cutoff]
+GOOGLE_FEEDS = [
+    {
+        "url": "https://news.google.com/rss/search?q=Tesla+autonomous+driving+OR+Autopilot+OR+FSD+OR+Robotaxi&hl=en-US&gl=US&ceid=US:en",
+        "locale": "en",
+    },
+    {
+        "url": "https://news.google.com/rss/search?q=%ED%85%8C%EC%8A%AC%EB%9D%BC+%EC%9E%90%EC%9C%A8%EC%A3%BC%ED%96%89+OR+%EB%A1%9C%EB%B3%B4%ED%83%9D%EC%8B%9C+OR+%EC%9E%90%EC%9C%A8%EC%9A%B4%EC%A0%84&hl=ko&gl=KR&ceid=KR:ko",
+        "locale": "ko",
+    },
+]
+NAVER_QUERIES = ["테슬라 자유주행", "테슬라 로보택시"]
+X_QUERIES = [X_QUERY]
 
 
 def deduplicate(items: Iterable[NewsItem]) -> List[NewsItem]:
@@ -47,13 +51,27 @@ def deduplicate(items: Iterable[NewsItem]) -> List[NewsItem]:
     return list(unique.values())
 
 
-def translate_items(items: Iterable[NewsItem]) -> List[NewsItem]:
+def translate_items(
+    items: Iterable[NewsItem],
+    deadline: Deadline | None = None,
+    report: RunReport | None = None,
+) -> List[NewsItem]:
+    deadline = deadline or Deadline(None)
     translated: List[NewsItem] = []
+    skipped = 0
+
+    def translate(text: str) -> str:
+        nonlocal skipped
+        if deadline.expired():
+            skipped += 1
+            return text
+        return translate_to_korean(text, timeout=deadline.timeout(10.0))
+
     for item in items:
-        translated_title = translate_to_korean(item.title)
-        translated_summary = translate_to_korean(item.summary)
+        translated_title = translate(item.title)
+        translated_summary = translate(item.summary)
         raw_highlights = item.highlights or []
-        translated_highlights = [translate_to_korean(point) for point in raw_highlights]
+        translated_highlights = [translate(point) for point in raw_highlights]
         if len(translated_highlights) < 2:
             translated_highlights = build_highlights(translated_summary)
         translated.append(
@@ -66,8 +84,11 @@ def translate_items(items: Iterable[NewsItem]) -> List[NewsItem]:
                 image_url=item.image_url,
                 language="ko",
                 highlights=translated_highlights,
+                thumbnails=item.thumbnails,
             )
         )
+    if report is not None:
+        report.degrade("translation", "kept original text for segments past the deadline", skipped)
     return translated
 
 
@@ -123,145 +144,378 @@ def build_highlights(text: str, max_points: int = 3) -> List[str]:
     return highlights[:max_points]
 
 
-def string_similarity(a: str, b: str) -> float:
-    if not a or not b:
-        return 0.0
-    return SequenceMatcher(None, a, b).ratio()
-
-
-def filter_similar(items: Iterable[NewsItem], scores: dict[str, float]) -> List[NewsItem]:
-    filtered: List[NewsItem] = []
-    for item in items:
-        keep = True
-        for idx, existing in enumerate(filtered):
-            title_sim = string_similarity(item.title, existing.title)
-            summary_sim = string_similarity(item.summary, existing.summary)
-            similarity = max(title_sim, summary_sim)
-            if similarity >= config.SIMILARITY_THRESHOLD:
-                if scores.get(item.url, 0.0) > scores.get(existing.url, 0.0):
-                    filtered[idx] = item
-                keep = False
-                break
-        if keep:
-            filtered.append(item)
-    return filtered
-
-
 def fallback_image(title: str) -> str:
     keywords = " ".join(title.split()[:4]).strip()
     query = quote_plus(f"tesla autonomous driving {keywords}")
     return f"https://source.unsplash.com/featured/?{query}"
 
 
-def collect_news() -> List[NewsItem]:
-    google_feeds = [
-        {
-            "url": "https://news.google.com/rss/search?q=Tesla+autonomous+driving+OR+Autopilot+OR+FSD+OR+Robotaxi&hl=en-US&gl=US&ceid=US:en",
-            "locale": "en",
-        },
-        {
-            "url": "https://news.google.com/rss/search?q=%ED%85%8C%EC%8A%AC%EB%9D%BC+%EC%9E%90%EC%9C%A8%EC%A3%BC%ED%96%89+OR+%EB%A1%9C%EB%B3%B4%ED%83%9D%EC%8B%9C+OR+%EC%9E%90%EC%9C%A8%EC%9A%B4%EC%A0%84&hl=ko&gl=KR&ceid=KR:ko",
-            "locale": "ko",
-        },
-    ]
+def collect_news(
+    run_id: str | None = None,
+    resume: bool = True,
+    deadline: float | None = None,
+    report: RunReport | None = None,
+    streaming: bool = False,
+) -> List[NewsItem]:
+    """Run the full pipeline.
+
+    ``deadline`` (seconds) bounds the whole run. Each stage gets a share of
+    what is left; once a stage's share runs out, enrichment falls back to feed
+    images and summary highlights and translation keeps the original text.
+    Pass a ``RunReport`` to collect stage timings and applied degradations.
+
+    ``streaming`` swaps the list-based fetch-to-selection stages for
+    ``stream_select``, which never holds more than the selector's top-k/pool
+    plus the sources in flight; use it for large source lists. Those stages
+    are not checkpointed in streaming mode.
+    """
+    report = report or RunReport()
+    report.run_id = run_id
+    report.deadline_seconds = deadline
+    overall = Deadline(deadline)
+    run = checkpoint.Run(run_id, resume=resume)
+    scheduler = SourceScheduler.load(build_sources(GOOGLE_FEEDS, NAVER_QUERIES, X_QUERIES))
+
+    if streaming:
+        top_items, candidates = stream_select(scheduler, overall.for_stage("sources"), report)
+        scheduler.fold()
+        scheduler.save()
+    else:
+        top_items, candidates = collect_candidates(run, scheduler, overall, report)
+    report.sources, report.estimated_seconds_saved = scheduler.summary()
+    report.skipped_sources = list(scheduler.skipped)
+
+    # A few runners-up are enriched and translated too, so that replacing a
+    # card the user rejects needs no network call.
+    prepared = top_items + pick_reserves(top_items, candidates, config.CANDIDATE_RESERVE)
+    enriched = run.stage(
+        "enrichment",
+        prepared,
+        lambda: enrich_items(prepared, overall.for_stage("enrichment"), report),
+    )
+    image_cache.persist_cache()
+    enriched = run.stage(
+        "thumbnails",
+        enriched,
+        lambda: attach_thumbnails(enriched, overall.for_stage("thumbnails"), report),
+    )
+    try:
+        thumbnails.persist_index()
+    except OSError as exc:
+        logger.warning("Failed to store thumbnail index: %s", exc)
+    translated = run.stage(
+        "translation",
+        enriched,
+        lambda: translate_items(enriched, overall.for_stage("translation"), report),
+    )
+    store_pool(candidates, translated)
+    translated = translated[: len(top_items)]
+    archive_items(translated, selected=True, translated=True)
+    report.stage_seconds = dict(run.timings)
+    report.resumed_stages = list(run.resumed)
+    run.complete()
+    return translated
 
-    collected: List[NewsItem] = []
-    collected.extend(fetch_google_news(google_feeds, limit_per_feed=12))
-    collected.extend(fetch_naver_news(["테슬라 자유주행", "테슬라 로보택시"], limit_per_query=8))
+
+def collect_candidates(
+    run: checkpoint.Run,
+    scheduler: SourceScheduler,
+    overall: Deadline,
+    report: RunReport,
+) -> Tuple[List[NewsItem], List[Candidate]]:
+    collected = run.stage(
+        "sources",
+        (GOOGLE_FEEDS, NAVER_QUERIES, X_QUERIES),
+        lambda: fetch_sources(scheduler, overall.for_stage("sources"), report),
+    )
 
     deduped = deduplicate(collected)
+    archive_items(deduped)
     focused = ensure_autonomy_focus(deduped)
 
-    focused = [item for item in focused if not feedback.should_exclude(item.url)]
-    scores = {item.url: feedback.score_article(item.title, item.summary) for item in focused}
-
-    recent = filter_recent(focused, config.RECENT_HOURS)
-    fallback_cutoff = datetime.now(config.KST) - timedelta(hours=config.RECENT_FALLBACK_HOURS)
-
-    if len(recent) < config.MAX_ITEMS:
-        extended = filter_recent(focused, config.RECENT_FALLBACK_HOURS)
-        urls = {item.url for item in recent}
-        for item in extended:
-            if len(recent) >= config.MAX_ITEMS:
-                break
-            if item.url in urls or feedback.should_exclude(item.url):
-                continue
-            recent.append(item)
-            urls.add(item.url)
-            scores.setdefault(item.url, feedback.score_article(item.title, item.summary))
-
-    if len(recent) < config.MAX_ITEMS:
-        urls = {item.url for item in recent}
-        for item in focused:
-            if len(recent) >= config.MAX_ITEMS:
-                break
-            if item.url in urls or feedback.should_exclude(item.url):
-                continue
-            if get_item_datetime(item) < fallback_cutoff:
-                continue
-            recent.append(item)
-            urls.add(item.url)
-            scores.setdefault(item.url, feedback.score_article(item.title, item.summary))
-
-    recent = [item for item in recent if get_item_datetime(item) >= fallback_cutoff]
-
-    if len(recent) < config.MIN_ITEMS:
+    feedback_version = feedback.get_updated_at()
+    scored = run.stage(
+        "scored",
+        (focused, feedback_version),
+        lambda: [(item, feedback.score_article(item.title, item.summary)) for item in focused],
+        encode=lambda pairs: [{"item": asdict(item), "score": score} for item, score in pairs],
+        decode=lambda raw: [(NewsItem(**entry["item"]), entry["score"]) for entry in raw],
+    )
+    top_items, candidates = run.stage(
+        "selection",
+        (scored, feedback_version),
+        lambda: select_items(scored),
+        encode=lambda result: {
+            "selected": [asdict(item) for item in result[0]],
+            "pool": [asdict(candidate) for candidate in result[1]],
+        },
+        decode=lambda raw: (
+            [NewsItem(**entry) for entry in raw["selected"]],
+            [Candidate(**{**entry, "item": NewsItem(**entry["item"])}) for entry in raw["pool"]],
+        ),
+    )
+    if scheduler.run:
+        scheduler.record_outcome(deduped, focused, top_items)
+        scheduler.save()
+    return top_items, candidates
+
+
+def fetch_source(source: Source, deadline: Deadline) -> List[NewsItem]:
+    if source.kind == "google":
+        return fetch_google_news([source.target], limit_per_feed=12, timeout=deadline.timeout(20.0))
+    if source.kind == "x":
+        return fetch_x_snippets(limit=3, timeout=deadline.timeout(20.0), query=source.target)
+    return fetch_naver_news([source.target], limit_per_query=8, timeout=deadline.timeout(15.0))
+
+
+def fetch_sources(
+    scheduler: SourceScheduler,
+    deadline: Deadline | None = None,
+    report: RunReport | None = None,
+) -> List[NewsItem]:
+    deadline = deadline or Deadline(None)
+    collected: List[NewsItem] = []
+    skipped = 0
+    for source in scheduler.plan():
+        if deadline.expired():
+            skipped += 1
+            continue
+        started = time.perf_counter()
+        items = fetch_source(source, deadline)
+        scheduler.record_fetch(source, items, time.perf_counter() - started)
+        collected.extend(items)
+    if report is not None:
+        report.degrade("sources", "skipped feeds/queries past the deadline", skipped)
+    return collected
+
+
+def iter_sources(
+    scheduler: SourceScheduler,
+    deadline: Deadline | None = None,
+    report: RunReport | None = None,
+    concurrency: int = config.SOURCE_CONCURRENCY,
+) -> Iterator[Tuple[str, NewsItem]]:
+    """Yield ``(source key, item)`` as fetches complete, with at most ``concurrency`` in flight.
+
+    The next source is only started once a finished one has been handed
+    downstream, so buffered items never exceed ``concurrency`` fetches' worth.
+    """
+    deadline = deadline or Deadline(None)
+    planned = iter(scheduler.plan())
+    skipped = 0
+
+    def timed_fetch(source: Source) -> Tuple[List[NewsItem], float]:
+        started = time.perf_counter()
+        return fetch_source(source, deadline), time.perf_counter() - started
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="fetch") as executor:
+        pending: Dict[Future, Source] = {}
+
+        def start_next() -> None:
+            nonlocal skipped
+            for source in planned:
+                if deadline.expired():
+                    skipped += 1
+                    continue
+                pending[executor.submit(timed_fetch, source)] = source
+                return
+
+        for _ in range(concurrency):
+            start_next()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                source = pending.pop(future)
+                try:
+                    items, seconds = future.result()
+                except Exception as exc:
+                    logger.warning("Failed to fetch %s: %s", source.key, exc)
+                    items, seconds = [], 0.0
+                scheduler.record_fetch(source, items, seconds, track=False)
+                for item in items:
+                    yield source.key, item
+                start_next()
+    if report is not None:
+        report.degrade("sources", "skipped feeds/queries past the deadline", skipped)
+
+
+def stream_unique(
+    pairs: Iterable[Tuple[str, NewsItem]],
+    seen_limit: int = config.STREAM_SEEN_KEYS,
+) -> Iterator[Tuple[str, NewsItem]]:
+    # Only the most recent ``seen_limit`` keys are remembered; an older
+    # duplicate that slips through still collapses in the selector.
+    seen: OrderedDict[str, None] = OrderedDict()
+    for key, item in pairs:
+        marker = item.url or item.title
+        if marker in seen:
+            seen.move_to_end(marker)
+            continue
+        seen[marker] = None
+        if len(seen) > seen_limit:
+            seen.popitem(last=False)
+        yield key, item
+
+
+def stream_archived(
+    pairs: Iterable[Tuple[str, NewsItem]],
+    batch_size: int = config.STREAM_ARCHIVE_BATCH,
+) -> Iterator[Tuple[str, NewsItem]]:
+    batch: List[NewsItem] = []
+    for key, item in pairs:
+        batch.append(item)
+        if len(batch) >= batch_size:
+            archive_items(batch)
+            batch = []
+        yield key, item
+    if batch:
+        archive_items(batch)
+
+
+def stream_focused(pairs: Iterable[Tuple[str, NewsItem]]) -> Iterator[Tuple[str, NewsItem]]:
+    for key, item in pairs:
+        if is_autonomy_related(f"{item.title} {item.summary}"):
+            yield key, item
+
+
+def stream_counted(
+    pairs: Iterable[Tuple[str, NewsItem]],
+    scheduler: SourceScheduler,
+    name: str,
+) -> Iterator[Tuple[str, NewsItem]]:
+    for key, item in pairs:
+        scheduler.attribute(key, name)
+        yield key, item
+
+
+def stream_select(
+    scheduler: SourceScheduler,
+    deadline: Deadline | None = None,
+    report: RunReport | None = None,
+) -> Tuple[List[NewsItem], List[Candidate]]:
+    """Fetch, dedupe, archive, filter, score and select in one bounded-memory pass."""
+    pairs = iter_sources(scheduler, deadline, report)
+    pairs = stream_counted(stream_archived(stream_unique(pairs)), scheduler, "unique")
+    pairs = stream_counted(stream_focused(pairs), scheduler, "surviving")
+
+    selector = CandidateSelector(config.MAX_ITEMS, pool_limit=config.CANDIDATE_POOL_SIZE)
+    origins: Dict[str, str] = {}
+    for key, item in pairs:
+        if selector.offer(item, feedback.score_article(item.title, item.summary)):
+            origins[item.url or item.title] = key
+            if len(origins) > 4 * selector.limit:
+                held = {entry.url or entry.title for entry in selector.results()}
+                origins = {marker: origin for marker, origin in origins.items() if marker in held}
+
+    selected = selector.results()
+    for item in selected:
+        scheduler.attribute(origins.get(item.url or item.title), "selected")
+    warn_if_short(selector)
+    return selected, selector.pool()
+
+
+def select_items(scored: Iterable[Tuple[NewsItem, float]]) -> Tuple[List[NewsItem], List[Candidate]]:
+    selector = CandidateSelector(config.MAX_ITEMS, pool_limit=config.CANDIDATE_POOL_SIZE)
+    for item, score in scored:
+        selector.offer(item, score)
+    warn_if_short(selector)
+    return selector.results(), selector.pool()
+
+
+def warn_if_short(selector: CandidateSelector) -> None:
+    if selector.eligible < config.MIN_ITEMS:
         logger.warning(
             "Only %d items found within the recent window (primary %d h / fallback %d h)",
-            len(recent),
+            selector.eligible,
             config.RECENT_HOURS,
             config.RECENT_FALLBACK_HOURS,
         )
 
-    recent = filter_similar(recent, scores)
-    if len(recent) < config.MAX_ITEMS:
-        used_urls = {item.url for item in recent}
-        candidates = [
-            item
-            for item in focused
-            if item.url not in used_urls and get_item_datetime(item) >= fallback_cutoff
-        ]
-        candidates.sort(
-            key=lambda item: (scores.get(item.url, 0.0), get_item_datetime(item)),
-            reverse=True,
+
+def pick_reserves(selected: List[NewsItem], candidates: List[Candidate], count: int) -> List[NewsItem]:
+    chosen: List[NewsItem] = []
+    taken = {item.url for item in selected}
+    for candidate in candidates:
+        if len(chosen) >= count:
+            break
+        item = candidate.item
+        if item.url in taken or any(is_similar(item, other) for other in selected + chosen):
+            continue
+        chosen.append(item)
+        taken.add(item.url)
+    return chosen
+
+
+def store_pool(candidates: List[Candidate], prepared: List[NewsItem]) -> None:
+    """Persist the candidate pool, swapping in enriched/translated versions where they exist."""
+    ready = {item.url: item for item in prepared}
+    stored: List[Candidate] = []
+    for candidate in candidates:
+        item = ready.get(candidate.item.url)
+        if item is None:
+            raw = candidate.item
+            item = NewsItem(
+                source=raw.source,
+                title=raw.title,
+                summary=raw.summary,
+                url=raw.url,
+                published_at=raw.published_at,
+                image_url=raw.image_url or fallback_image(raw.title),
+                language=raw.language,
+                highlights=raw.highlights or build_highlights(raw.summary),
+            )
+        stored.append(
+            Candidate(
+                item=item,
+                score=candidate.score,
+                tier=candidate.tier,
+                ready=candidate.item.url in ready,
+                text=candidate.text,
+            )
         )
-        for candidate in candidates:
-            if len(recent) >= config.MAX_ITEMS:
-                break
-            duplicate = False
-            for existing in recent:
-                title_sim = string_similarity(candidate.title, existing.title)
-                summary_sim = string_similarity(candidate.summary, existing.summary)
-                if max(title_sim, summary_sim) >= config.SIMILARITY_THRESHOLD:
-                    duplicate = True
-                    break
-            if duplicate:
-                continue
-            recent.append(candidate)
-            used_urls.add(candidate.url)
-    recent.sort(key=lambda item: (scores.get(item.url, 0.0), get_item_datetime(item)), reverse=True)
-
-    top_items = recent[: config.MAX_ITEMS]
-    enriched = enrich_items(top_items)
-    translated = translate_items(enriched)
-    image_cache.persist_cache()
-    return translated
+    try:
+        pool.save_pool(stored)
+    except OSError as exc:
+        logger.warning("Failed to store candidate pool: %s", exc)
+
 
+def archive_items(items: List[NewsItem], selected: bool = False, translated: bool = False) -> None:
+    try:
+        archive.upsert_items(items, selected=selected, translated=translated)
+    except sqlite3.Error as exc:
+        logger.warning("Failed to update news archive: %s", exc)
 
-def write_news(items: List[NewsItem]) -> dict:
+
+def write_news(items: List[NewsItem], report: RunReport | None = None) -> dict:
     payload = {
         "updated_at": datetime.now(config.KST).isoformat(),
         "items": [asdict(item) for item in items],
     }
-    config.DATA_DIR.mkdir(parents=True, exist_ok=True)
-    config.DATA_FILE.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    if report is not None:
+        payload["report"] = asdict(report)
+    render.attach(payload)
+    storage.atomic_write_json(config.DATA_FILE, payload)
+    try:
+        storage.write_snapshot(payload)
+    except OSError as exc:
+        logger.warning("Failed to store versioned snapshot: %s", exc)
     return payload
 
 
-def enrich_items(items: Iterable[NewsItem]) -> List[NewsItem]:
+def enrich_items(
+    items: Iterable[NewsItem],
+    deadline: Deadline | None = None,
+    report: RunReport | None = None,
+) -> List[NewsItem]:
+    deadline = deadline or Deadline(None)
     enriched: List[NewsItem] = []
+    degraded = 0
     for item in items:
-        article_data = image_cache.resolve_article_data(item.url)
+        if deadline.expired():
+            article_data = {}
+            degraded += 1
+        else:
+            article_data = image_cache.resolve_article_data(item.url, timeout=deadline.timeout(image_cache.ARTICLE_TIMEOUT))
 
         image_url = article_data.get("image") or item.image_url or fallback_image(item.title)
 
@@ -279,4 +533,26 @@ def enrich_items(items: Iterable[NewsItem]) -> List[NewsItem]:
                 highlights=raw_highlights,
             )
         )
+    if report is not None:
+        report.degrade("enrichment", "used feed image and summary highlights past the deadline", degraded)
     return enriched
+
+
+def attach_thumbnails(
+    items: Iterable[NewsItem],
+    deadline: Deadline | None = None,
+    report: RunReport | None = None,
+) -> List[NewsItem]:
+    deadline = deadline or Deadline(None)
+    attached: List[NewsItem] = []
+    skipped = 0
+    for item in items:
+        if deadline.expired():
+            skipped += 1
+            attached.append(item)
+            continue
+        files = thumbnails.ensure_thumbnails(item.image_url, timeout=deadline.timeout(15.0))
+        attached.append(replace(item, thumbnails=files))
+    if report is not None:
+        report.degrade("thumbnails", "left cards without a local thumbnail past the deadline", skipped)
+    return attached
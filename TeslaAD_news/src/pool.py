@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import json
+from dataclasses import asdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from . import config, feedback, render, storage
+from .models import Candidate, NewsItem
+from .selection import CandidateSelector
+
+
+def save_pool(candidates: List[Candidate]) -> None:
+    payload = {
+        "updated_at": datetime.now(config.KST).isoformat(),
+        "candidates": [asdict(candidate) for candidate in candidates],
+    }
+    storage.atomic_write_json(config.CANDIDATE_POOL_FILE, payload, encoding="compact")
+
+
+def load_pool() -> List[Candidate]:
+    try:
+        raw = storage.read_json(config.CANDIDATE_POOL_FILE)
+    except (OSError, ValueError):
+        return []
+    candidates: List[Candidate] = []
+    for entry in raw.get("candidates", []):
+        try:
+            candidates.append(
+                Candidate(
+                    item=NewsItem(**entry["item"]),
+                    score=entry["score"],
+                    tier=entry["tier"],
+                    ready=entry.get("ready", False),
+                    text=entry.get("text", ""),
+                )
+            )
+        except (KeyError, TypeError):
+            continue
+    return candidates
+
+
+def load_snapshot() -> Optional[Dict[str, Any]]:
+    try:
+        return json.loads(config.DATA_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def write_snapshot(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Re-render and atomically replace ``news.json`` after a local edit."""
+    payload["revised_at"] = datetime.now(config.KST).isoformat()
+    render.attach(payload)
+    storage.atomic_write_json(config.DATA_FILE, payload)
+    return payload
+
+
+def rerank() -> Optional[Dict[str, Any]]:
+    """Re-score the snapshot and stored pool against the current token weights.
+
+    Runs the same single-pass selection as the pipeline over the pool plus
+    whatever is on the page, so excluded cards drop out, better-scoring
+    candidates move in and the order follows the new weights. Only shown cards
+    and ``ready`` (already enriched and translated) candidates can take a
+    slot; the rest are re-ranked within the pool only. Recency windows
+    are measured from the snapshot's ``updated_at``, and the page never loses
+    cards other than excluded ones. The snapshot and pool are rewritten
+    atomically; returns the new snapshot, or ``None`` when there is no snapshot.
+    """
+    payload = load_snapshot()
+    if payload is None:
+        return None
+
+    shown = {entry.get("url"): entry for entry in payload.get("items", [])}
+    candidates = {candidate.item.url: candidate for candidate in load_pool()}
+    for url, entry in shown.items():
+        if url not in candidates:
+            item = _to_item(entry)
+            candidates[url] = Candidate(item=item, score=0.0, tier=0, ready=True, text=f"{item.title} {item.summary}")
+
+    selector = CandidateSelector(
+        config.MAX_ITEMS, now=_snapshot_time(payload), pool_limit=config.CANDIDATE_POOL_SIZE
+    )
+    for candidate in candidates.values():
+        # Candidate text is the original, untranslated "title summary".
+        promotable = candidate.ready or candidate.item.url in shown
+        selector.offer(candidate.item, feedback.score_article(candidate.text, ""), pool_only=not promotable)
+
+    selected = selector.results()
+    kept = [url for url in shown if not feedback.should_exclude(url)]
+    missing = min(len(kept), config.MAX_ITEMS) - len(selected)
+    if missing > 0:
+        chosen = {item.url for item in selected}
+        selected.extend([candidates[url].item for url in kept if url not in chosen][:missing])
+    payload["items"] = [
+        shown.get(item.url) or asdict(item)
+        for item in selected
+    ]
+    rescored = [
+        Candidate(
+            item=candidate.item,
+            score=candidate.score,
+            tier=candidate.tier,
+            ready=candidates[candidate.item.url].ready,
+            text=candidates[candidate.item.url].text,
+        )
+        for candidate in selector.pool()
+    ]
+    if rescored:
+        save_pool(rescored)
+    return write_snapshot(payload)
+
+
+def _snapshot_time(payload: Dict[str, Any]) -> datetime:
+    try:
+        updated_at = datetime.fromisoformat(payload["updated_at"])
+    except (KeyError, TypeError, ValueError):
+        return datetime.now(config.KST)
+    if updated_at.tzinfo is None:
+        return config.KST.localize(updated_at)
+    return updated_at
+
+
+def _to_item(entry: Dict[str, Any]) -> NewsItem:
+    return NewsItem(
+        source=entry.get("source", ""),
+        title=entry.get("title", ""),
+        summary=entry.get("summary", ""),
+        url=entry.get("url", ""),
+        published_at=entry.get("published_at", ""),
+        image_url=entry.get("image_url"),
+        language=entry.get("language"),
+        highlights=entry.get("highlights"),
+        thumbnails=entry.get("thumbnails"),
+    )
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import cProfile
+import io
+import logging
+import os
+import pstats
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from pathlib import Path
+from typing import ContextManager, Iterator, Optional
+
+from . import config
+
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENV = "TESLAAD_PROFILE"
+MODES = ("cprofile", "pyinstrument")
+SAMPLE_INTERVAL = 0.005
+
+_NULL = nullcontext()
+_session: Optional["ProfileSession"] = None
+
+
+class ProfileSession:
+    """Profiles named pipeline stages into one run directory.
+
+    Every stage gets ``<stage>.prof`` (cProfile) and ``<stage>.txt`` (top
+    functions by cumulative time), or ``<stage>.html`` in pyinstrument mode.
+    A background sampler also records the profiled thread's stack every
+    ``SAMPLE_INTERVAL`` seconds into ``stacks.folded``, one
+    ``stage;frame;frame count`` line per unique stack, ready for
+    flamegraph.pl or speedscope.
+    """
+
+    def __init__(self, directory: Path, mode: str = "cprofile") -> None:
+        if mode not in MODES:
+            raise ValueError(f"Unknown profile mode: {mode}")
+        if mode == "pyinstrument":
+            try:
+                import pyinstrument  # noqa: F401
+            except ImportError:
+                logger.warning("pyinstrument is not installed; falling back to cProfile")
+                mode = "cprofile"
+        self.mode = mode
+        self.directory = directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.stacks: Counter[str] = Counter()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        profiler = self._pyinstrument(name) if self.mode == "pyinstrument" else self._cprofile(name)
+        sampler = _StackSampler(name, threading.get_ident(), self.stacks)
+        try:
+            with profiler:
+                sampler.start()
+                try:
+                    yield
+                finally:
+                    sampler.stop()
+        finally:
+            self._write_stacks()
+
+    @contextmanager
+    def _cprofile(self, name: str) -> Iterator[None]:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            profiler.dump_stats(str(self.directory / f"{name}.prof"))
+            buffer = io.StringIO()
+            pstats.Stats(profiler, stream=buffer).sort_stats("cumulative").print_stats(40)
+            (self.directory / f"{name}.txt").write_text(buffer.getvalue(), encoding="utf-8")
+
+    @contextmanager
+    def _pyinstrument(self, name: str) -> Iterator[None]:
+        from pyinstrument import Profiler
+
+        profiler = Profiler()
+        profiler.start()
+        try:
+            yield
+        finally:
+            profiler.stop()
+            (self.directory / f"{name}.html").write_text(profiler.output_html(), encoding="utf-8")
+            (self.directory / f"{name}.txt").write_text(profiler.output_text(), encoding="utf-8")
+
+    def _write_stacks(self) -> None:
+        lines = [f"{stack} {count}" for stack, count in sorted(self.stacks.items())]
+        (self.directory / "stacks.folded").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+class _StackSampler(threading.Thread):
+    def __init__(self, stage: str, thread_id: int, stacks: Counter) -> None:
+        super().__init__(name=f"profile-sampler-{stage}", daemon=True)
+        self.stage = stage
+        self.thread_id = thread_id
+        self.stacks = stacks
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.wait(SAMPLE_INTERVAL):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+                frame = frame.f_back
+            names.append(self.stage)
+            self.stacks[";".join(reversed(names))] += 1
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self.join()
+
+
+def start(mode: str, directory: Path | None = None) -> ProfileSession:
+    global _session
+    if directory is None:
+        directory = config.PROFILE_DIR / datetime.now(config.KST).strftime("%Y%m%d-%H%M%S")
+    _session = ProfileSession(directory, mode)
+    logger.info("Profiling pipeline stages (%s) into %s", _session.mode, directory)
+    return _session
+
+
+def start_from_env() -> Optional[ProfileSession]:
+    mode = os.environ.get(PROFILE_ENV, "").strip().lower()
+    if not mode or mode in {"0", "off", "false"}:
+        return None
+    if mode in {"1", "on", "true"}:
+        mode = "cprofile"
+    if mode not in MODES:
+        logger.warning("Ignoring %s=%s: expected one of %s; profiling is off", PROFILE_ENV, mode, ", ".join(MODES))
+        return None
+    return start(mode)
+
+
+def stage(name: str) -> ContextManager[None]:
+    """Profile ``name`` when a session is active; a shared no-op context otherwise."""
+    if _session is None:
+        return _NULL
+    return _session.stage(name)
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from datetime import datetime
+from html import escape
+from typing import Any, Dict
+
+from . import config
+
+
+# Bump whenever the fields produced by render_item or the card markup change,
+# so the app re-renders older snapshots itself instead of trusting them.
+SCHEMA_VERSION = 3
+
+
+def format_time(iso_str: str) -> str:
+    try:
+        dt = datetime.fromisoformat(iso_str)
+        if dt.tzinfo is None:
+            dt = config.KST.localize(dt)
+        else:
+            dt = dt.astimezone(config.KST)
+        return dt.strftime("%Y-%m-%d %H:%M")
+    except Exception:
+        return iso_str
+
+
+def render_item(item: Dict[str, Any]) -> Dict[str, str]:
+    highlights = item.get("highlights") or []
+    if highlights:
+        highlights_html = "<ul>" + "".join(f"<li>{escape(point)}</li>" for point in highlights) + "</ul>"
+    else:
+        summary_text = escape(item.get("summary", ""))
+        highlights_html = f"<p>{summary_text}</p>" if summary_text else ""
+
+    thumbnails = item.get("thumbnails") or {}
+    thumb_html = ""
+    if thumbnails:
+        widths = sorted(thumbnails, key=int)
+        srcset = ", ".join(f"{config.THUMBNAIL_URL_PREFIX}/{thumbnails[width]} {width}w" for width in widths)
+        thumb_html = (
+            f"<img class=\"tesla-card-thumb\" src=\"{config.THUMBNAIL_URL_PREFIX}/{thumbnails[widths[0]]}\" "
+            f"srcset=\"{srcset}\" sizes=\"(max-width: 640px) 100vw, 25vw\" loading=\"lazy\" decoding=\"async\" alt=\"\">"
+        )
+
+    title_html = escape(item["title"])
+    published_kst = format_time(item["published_at"])
+    card_html = f"""
+            <div class=\"tesla-card\">
+              <a href=\"{item['url']}\" target=\"_blank\" rel=\"noopener noreferrer\">
+                {thumb_html}
+                <div class=\"tesla-card-content\">
+                  <h3>{title_html}</h3>
+                  {highlights_html}
+                  <div class=\"tesla-card-footer\">
+                    <span>{escape(item['source'])}</span>
+                    <span>{published_kst}</span>
+                  </div>
+                </div>
+              </a>
+            </div>
+            """
+    return {
+        "title_html": title_html,
+        "highlights_html": highlights_html,
+        "published_kst": published_kst,
+        "card_html": card_html,
+    }
+
+
+def attach(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Store render-ready fields on every item of a snapshot payload."""
+    for item in payload.get("items", []):
+        item["render"] = render_item(item)
+    payload["updated_at_kst"] = format_time(payload.get("updated_at", ""))
+    payload["schema_version"] = SCHEMA_VERSION
+    return payload
+
+
+def card_html(item: Dict[str, Any], payload: Dict[str, Any]) -> str:
+    rendered = item.get("render") if payload.get("schema_version") == SCHEMA_VERSION else None
+    if not rendered:
+        rendered = render_item(item)
+    return rendered["card_html"]
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Tuple
+
+from . import config, storage
+from .models import NewsItem
+
+
+logger = logging.getLogger(__name__)
+
+STAT_FIELDS = ("fetched", "unique", "surviving", "selected", "seconds")
+
+
+@dataclass
+class Source:
+    key: str
+    kind: str  # "google" | "naver" | "x"
+    target: Any  # feed dict for google, query string for naver and x
+
+
+def build_sources(
+    google_feeds: Iterable[dict],
+    naver_queries: Iterable[str],
+    x_queries: Iterable[str] = (),
+) -> List[Source]:
+    sources = [
+        Source(
+            key=f"google:{feed.get('locale', '')}:{hashlib.sha1(feed['url'].encode('utf-8')).hexdigest()[:8]}",
+            kind="google",
+            target=feed,
+        )
+        for feed in google_feeds
+    ]
+    sources.extend(Source(key=f"naver:{query}", kind="naver", target=query) for query in naver_queries)
+    sources.extend(
+        Source(key=f"x:{hashlib.sha1(query.encode('utf-8')).hexdigest()[:8]}", kind="x", target=query)
+        for query in x_queries
+    )
+    return sources
+
+
+class SourceScheduler:
+    """Orders and skips sources by their historical yield.
+
+    Every source keeps exponentially weighted averages of how many items it
+    returned, how many were unique, survived the autonomy filter and made the
+    final selection, and how long it took. Sources are fetched best
+    yield-per-second first, so a tight deadline cuts the weakest ones. Once a
+    source has SOURCE_MIN_RUNS of history and its surviving yield stays below
+    SOURCE_LOW_YIELD it is skipped, except every SOURCE_PROBE_EVERY runs when it
+    is fetched again to see whether it recovered.
+    """
+
+    def __init__(self, sources: List[Source], stats: Dict[str, dict] | None = None) -> None:
+        self.sources = sources
+        self.stats = stats if stats is not None else {}
+        self.origins: Dict[str, str] = {}
+        self.run: Dict[str, Dict[str, float]] = {}
+        self.skipped: List[str] = []
+
+    @classmethod
+    def load(cls, sources: List[Source]) -> "SourceScheduler":
+        try:
+            stats = storage.read_json(config.SOURCE_STATS_FILE)
+        except (OSError, ValueError):
+            stats = {}
+        return cls(sources, stats if isinstance(stats, dict) else {})
+
+    def plan(self) -> List[Source]:
+        """Sources to fetch this run, best first. Skipped ones land in ``self.skipped``."""
+        planned: List[Source] = []
+        self.skipped = []
+        for source in self.sources:
+            stat = self.stats.get(source.key)
+            if stat and self._is_low_yield(stat) and stat.get("since_fetch", 0) + 1 < config.SOURCE_PROBE_EVERY:
+                self.skipped.append(source.key)
+                continue
+            planned.append(source)
+        planned.sort(key=lambda source: self._priority(source.key), reverse=True)
+        return planned
+
+    def record_fetch(self, source: Source, items: List[NewsItem], seconds: float, track: bool = True) -> None:
+        """Note one fetch. With ``track=False`` the caller attributes items itself via ``attribute``."""
+        self.run[source.key] = {
+            "fetched": len(items),
+            "unique": 0,
+            "surviving": 0,
+            "selected": 0,
+            "seconds": round(seconds, 3),
+        }
+        if track:
+            for item in items:
+                self.origins.setdefault(item.url or item.title, source.key)
+
+    def attribute(self, key: str | None, name: str) -> None:
+        if key in self.run:
+            self.run[key][name] += 1
+
+    def record_outcome(
+        self,
+        unique: Iterable[NewsItem],
+        surviving: Iterable[NewsItem],
+        selected: Iterable[NewsItem],
+    ) -> None:
+        """Attribute the run's deduplicated, focused and selected items and fold them into the averages."""
+        if not self.run:
+            return  # sources came from a checkpoint; nothing was fetched this run
+        for name, items in (("unique", unique), ("surviving", surviving), ("selected", selected)):
+            for item in items:
+                self.attribute(self.origins.get(item.url or item.title), name)
+        self.fold()
+
+    def fold(self) -> None:
+        """Fold this run's per-source counts into the running averages."""
+        alpha = config.SOURCE_EWMA_ALPHA
+        now = datetime.now(config.KST).isoformat()
+        for source in self.sources:
+            stat = self.stats.setdefault(source.key, {"runs": 0, "since_fetch": 0})
+            observed = self.run.get(source.key)
+            if observed is None:
+                stat["since_fetch"] = stat.get("since_fetch", 0) + 1
+                continue
+            for field in STAT_FIELDS:
+                value = observed.get(field, 0)
+                previous = stat.get(field)
+                stat[field] = value if previous is None else round(previous + alpha * (value - previous), 3)
+            stat["runs"] = stat.get("runs", 0) + 1
+            stat["since_fetch"] = 0
+            stat["last_fetched"] = now
+
+    def save(self) -> None:
+        try:
+            storage.atomic_write_json(config.SOURCE_STATS_FILE, self.stats)
+        except OSError as exc:
+            logger.warning("Failed to store source statistics: %s", exc)
+
+    def summary(self) -> Tuple[Dict[str, Dict[str, float]], float]:
+        """This run's per-source numbers and the estimated seconds saved by skipping."""
+        saved = sum(self.stats.get(key, {}).get("seconds", 0.0) for key in self.skipped)
+        return dict(self.run), round(saved, 3)
+
+    def _is_low_yield(self, stat: dict) -> bool:
+        if stat.get("runs", 0) < config.SOURCE_MIN_RUNS:
+            return False
+        return stat.get("surviving", 0.0) < config.SOURCE_LOW_YIELD
+
+    def _priority(self, key: str) -> float:
+        stat = self.stats.get(key)
+        if not stat or not stat.get("runs"):
+            return math.inf  # no history yet: fetch early to learn about it
+        value = stat.get("selected", 0.0) + 0.25 * stat.get("surviving", 0.0)
+        return value / max(stat.get("seconds", 0.0), 0.1)
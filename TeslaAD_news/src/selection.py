@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import heapq
+from datetime import datetime, timedelta
+from typing import List, Tuple
+
+from . import config, feedback
+from .models import Candidate, NewsItem
+from .similarity import is_similar
+
+
+def get_item_datetime(item: NewsItem) -> datetime:
+    try:
+        dt = datetime.fromisoformat(item.published_at)
+        if dt.tzinfo is None:
+            return config.KST.localize(dt)
+        return dt.astimezone(config.KST)
+    except Exception:
+        return datetime.now(config.KST)
+
+
+class CandidateSelector:
+    """Single-pass bounded top-k selection over scored items.
+
+    Items are ranked by ``(score, datetime)``. Anything inside the primary window
+    outranks items that only fall inside the fallback window, so the fallback
+    window only fills slots the primary window cannot. Excluded URLs are skipped
+    and near-duplicates collapse onto the higher ranked item on admission.
+    The best entries turned away for capacity are kept in a bounded backfill
+    heap, so slots freed by a collapse are refilled as ``filter_similar`` would.
+    """
+
+    def __init__(
+        self,
+        limit: int = config.MAX_ITEMS,
+        primary_hours: int = config.RECENT_HOURS,
+        fallback_hours: int = config.RECENT_FALLBACK_HOURS,
+        now: datetime | None = None,
+        pool_limit: int = 0,
+    ) -> None:
+        now = now or datetime.now(config.KST)
+        self.limit = limit
+        self.pool_limit = pool_limit
+        self.primary_cutoff = now - timedelta(hours=primary_hours)
+        self.fallback_cutoff = now - timedelta(hours=fallback_hours)
+        self.eligible = 0
+        self._heap: List[Tuple[int, float, datetime, int, NewsItem]] = []
+        self._pool: List[Tuple[int, float, datetime, int, NewsItem]] = []
+        self._backfill: List[Tuple[int, float, datetime, int, NewsItem]] = []
+        self.backfill_limit = 2 * limit
+        self._seq = 0
+
+    def offer(self, item: NewsItem, score: float, pool_only: bool = False) -> bool:
+        """Consider ``item``; True if it currently holds a result slot.
+
+        With ``pool_only`` the item is ranked into the pool but never takes a
+        result slot.
+        """
+        if feedback.should_exclude(item.url):
+            return False
+        published = get_item_datetime(item)
+        if published < self.fallback_cutoff:
+            return False
+        self.eligible += 1
+        self._seq += 1
+        tier = 1 if published >= self.primary_cutoff else 0
+        # The negated sequence keeps earlier items ahead on ties and means
+        # heap entries never fall through to comparing NewsItem instances.
+        entry = (tier, score, published, -self._seq, item)
+        if self.pool_limit:
+            if len(self._pool) < self.pool_limit:
+                heapq.heappush(self._pool, entry)
+            elif entry[:4] > self._pool[0][:4]:
+                heapq.heapreplace(self._pool, entry)
+        if pool_only:
+            return False
+
+        heap = self._heap
+        if len(heap) >= self.limit and entry[:4] < heap[0][:4]:
+            self._hold_back(entry)
+            return False
+        admitted = self._admit(entry)
+        while len(heap) < self.limit and self._backfill:
+            best = max(self._backfill, key=lambda held: held[:4])
+            self._backfill.remove(best)
+            heapq.heapify(self._backfill)
+            self._admit(best)
+        return admitted
+
+    def _admit(self, entry: Tuple[int, float, datetime, int, NewsItem]) -> bool:
+        heap = self._heap
+        similar = [held for held in heap if is_similar(entry[4], held[4])]
+        if any(held[:4] > entry[:4] for held in similar):
+            return False
+        if similar:
+            dropped = {id(held) for held in similar}
+            heap[:] = [held for held in heap if id(held) not in dropped]
+            heapq.heapify(heap)
+
+        heapq.heappush(heap, entry)
+        if len(heap) > self.limit:
+            self._hold_back(heapq.heappop(heap))
+        return True
+
+    def _hold_back(self, entry: Tuple[int, float, datetime, int, NewsItem]) -> None:
+        if len(self._backfill) < self.backfill_limit:
+            heapq.heappush(self._backfill, entry)
+        elif entry[:4] > self._backfill[0][:4]:
+            heapq.heapreplace(self._backfill, entry)
+
+    def results(self) -> List[NewsItem]:
+        ranked = sorted(self._heap, key=lambda entry: entry[1:4], reverse=True)
+        return [entry[4] for entry in ranked]
+
+    def pool(self) -> List[Candidate]:
+        """Best ``pool_limit`` eligible items, best first, without similarity collapsing."""
+        ranked = sorted(self._pool, key=lambda entry: entry[:4], reverse=True)
+        return [
+            Candidate(item=entry[4], score=entry[1], tier=entry[0], text=f"{entry[4].title} {entry[4].summary}")
+            for entry in ranked
+        ]
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from difflib import SequenceMatcher
+
+from . import config
+from .models import NewsItem
+
+
+def string_similarity(a: str, b: str) -> float:
+    if not a or not b:
+        return 0.0
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def is_similar(a: NewsItem, b: NewsItem) -> bool:
+    title_sim = string_similarity(a.title, b.title)
+    summary_sim = string_similarity(a.summary, b.summary)
+    return max(title_sim, summary_sim) >= config.SIMILARITY_THRESHOLD
@@ -3,11 +3,11 @@ from __future__ import annotations
 import logging
 from datetime import datetime
 from email.utils import parsedate_to_datetime
-from typing import Iterable, List
+from html.parser import HTMLParser
+from typing import IO, Iterable, List, Optional
 from xml.etree import ElementTree as ET
 
 import requests
-from bs4 import BeautifulSoup
 
 from .. import config
 from ..models import NewsItem
@@ -22,52 +22,107 @@ from ..utils import (
 logger = logging.getLogger(__name__)
 
 
-def fetch_google_news(feeds: Iterable[dict], limit_per_feed: int = 6) -> List[NewsItem]:
+class DescriptionExtractor(HTMLParser):
+    """First link, first image and plain text of an RSS ``<description>``.
+
+    Google News descriptions are a couple of anchors and ``<font>`` tags, so a
+    plain tokenizer is enough and far cheaper than building a soup per item.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.link: Optional[str] = None
+        self.image: Optional[str] = None
+        self.parts: List[str] = []
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        if tag == "a" and self.link is None:
+            href = dict(attrs).get("href")
+            if href and href.strip():
+                self.link = href.strip()
+        elif tag == "img" and self.image is None:
+            src = dict(attrs).get("src")
+            if src is not None:
+                self.image = src.strip()
+
+    def handle_data(self, data: str) -> None:
+        data = data.strip()
+        if data:
+            self.parts.append(data)
+
+    @property
+    def text(self) -> str:
+        return " ".join(self.parts)
+
+
+def extract_description(description_raw: str) -> DescriptionExtractor:
+    extractor = DescriptionExtractor()
+    extractor.feed(description_raw)
+    extractor.close()
+    return extractor
+
+
+def fetch_google_news(feeds: Iterable[dict], limit_per_feed: int = 6, timeout: float = 20.0) -> List[NewsItem]:
     items: List[NewsItem] = []
     for feed in feeds:
         url = feed["url"]
         try:
-            response = requests.get(url, headers={"User-Agent": config.USER_AGENT}, timeout=20)
-            response.raise_for_status()
+            with requests.get(url, headers={"User-Agent": config.USER_AGENT}, timeout=timeout, stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                items.extend(parse_feed(response.raw, feed.get("locale"), limit_per_feed))
         except Exception as exc:
             logger.warning("Failed to fetch Google News feed %s: %s", url, exc)
-            continue
-
-        root = ET.fromstring(response.content)
-        for entry in root.findall(".//item")[:limit_per_feed]:
-            title = clean_text(entry.findtext("title") or "")
-            link = entry.findtext("link") or ""
-            description_raw = entry.findtext("description") or ""
-            desc_soup = BeautifulSoup(description_raw, "html.parser")
-            anchor = desc_soup.find("a", href=True)
-            if anchor and anchor.get("href"):
-                link = anchor["href"].strip()
-            img_tag = desc_soup.find("img", src=True)
-            image_url = img_tag["src"].strip() if img_tag else extract_image_url(description_raw)
-            summary_html = desc_soup.get_text(" ", strip=True)
-            summary = summarise_text(summary_html, 180)
-            published_raw = entry.findtext("pubDate") or ""
-            try:
-                published_dt = parsedate_to_datetime(published_raw)
-                published_at = published_dt.astimezone(config.KST).isoformat()
-            except Exception:
-                published_at = datetime.now(config.KST).isoformat()
-
-            combined = f"{title} {summary}"
-            if is_stock_related(combined):
+    return items
+
+
+def parse_feed(source: IO[bytes], locale: str | None, limit: int) -> List[NewsItem]:
+    """Parse RSS ``<item>`` elements as they stream in, stopping after ``limit`` accepted items."""
+    items: List[NewsItem] = []
+    try:
+        for _, entry in ET.iterparse(source, events=("end",)):
+            if entry.tag != "item":
                 continue
-            if not is_autonomy_related(combined):
+            item = _parse_entry(entry, locale)
+            entry.clear()
+            if item is None:
                 continue
-
-            items.append(
-                NewsItem(
-                    source="Google 뉴스",
-                    title=title,
-                    summary=summary,
-                    url=link,
-                    published_at=published_at,
-                    image_url=image_url,
-                    language=feed.get("locale"),
-                )
-            )
+            items.append(item)
+            if len(items) >= limit:
+                break
+    except ET.ParseError as exc:
+        logger.warning("Malformed Google News feed, kept %d items: %s", len(items), exc)
     return items
+
+
+def _parse_entry(entry: ET.Element, locale: str | None) -> NewsItem | None:
+    title = clean_text(entry.findtext("title") or "")
+    link = entry.findtext("link") or ""
+    description_raw = entry.findtext("description") or ""
+    description = extract_description(description_raw)
+    if description.link:
+        link = description.link
+    image_url = description.image if description.image is not None else extract_image_url(description_raw)
+    summary = summarise_text(description.text, 180)
+    published_raw = entry.findtext("pubDate") or ""
+    try:
+        published_dt = parsedate_to_datetime(published_raw)
+        published_at = published_dt.astimezone(config.KST).isoformat()
+    except Exception:
+        published_at = datetime.now(config.KST).isoformat()
+
+    combined = f"{title} {summary}"
+    if is_stock_related(combined):
+        return None
+    if not is_autonomy_related(combined):
+        return None
+
+    return NewsItem(
+        source="Google 뉴스",
+        title=title,
+        summary=summary,
+        url=link,
+        published_at=published_at,
+        image_url=image_url,
+        language=locale,
+    )
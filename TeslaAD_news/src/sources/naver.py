@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timedelta
-from typing import Iterable, List
+from html.parser import HTMLParser
+from typing import Any, Dict, Iterable, Iterator, List, Set, Tuple
 
 import requests
 from bs4 import BeautifulSoup
@@ -11,7 +12,6 @@ from .. import config
 from ..models import NewsItem
 from ..utils import (
     clean_text,
-    extract_image_url,
     is_autonomy_related,
     is_stock_related,
     summarise_text,
@@ -20,7 +20,7 @@ from ..utils import (
 logger = logging.getLogger(__name__)
 
 
-def fetch_naver_news(queries: Iterable[str], limit_per_query: int = 4) -> List[NewsItem]:
+def fetch_naver_news(queries: Iterable[str], limit_per_query: int = 4, timeout: float = 15.0) -> List[NewsItem]:
     items: List[NewsItem] = []
     headers = {
         "User-Agent": (
@@ -35,54 +35,206 @@ def fetch_naver_news(queries: Iterable[str], limit_per_query: int = 4) -> List[N
                 "https://m.search.naver.com/search.naver",
                 params=params,
                 headers=headers,
-                timeout=15,
+                timeout=timeout,
             )
             response.raise_for_status()
         except Exception as exc:
             logger.warning("Failed to fetch Naver news for query %s: %s", query, exc)
             continue
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        for wrap in soup.select("div.news_wrap")[:limit_per_query]:
-            title_el = wrap.select_one("a.news_tit, a.api_txt_lines")
-            if not title_el:
-                continue
-            title = clean_text(title_el.get_text())
-            link = title_el.get("href") or ""
-            summary_el = wrap.select_one("div.dsc_wrap, a.api_txt_lines.dsc_txt")
-            summary = summarise_text(summary_el.get_text(" ", strip=True) if summary_el else title, 180)
-            source_el = wrap.select_one("span.info")
-            source_name = clean_text(source_el.get_text()) if source_el else "네이버 뉴스"
-            time_el = wrap.select_one("span.info_group span")
-            published_at = parse_relative_time(clean_text(time_el.get_text()) if time_el else "")
-
-            image_el = wrap.select_one("div.thumb img")
-            image_url = image_el.get("data-src") if image_el and image_el.get("data-src") else None
-            if not image_url and image_el:
-                image_url = image_el.get("src")
-            if not image_url:
-                image_url = config.DEFAULT_IMAGE_URL
-
-            combined = f"{title} {summary}"
-            if is_stock_related(combined):
-                continue
-            if not is_autonomy_related(combined):
-                continue
-
-            items.append(
-                NewsItem(
-                    source=f"네이버 - {source_name}" if source_name else "네이버 뉴스",
-                    title=title,
-                    summary=summary,
-                    url=link,
-                    published_at=published_at,
-                    image_url=image_url,
-                    language="ko",
-                )
-            )
+        items.extend(parse_results(response.text, limit_per_query))
+    return items
+
+
+# Naver's mobile results page is mostly scripts, ads and navigation; only the
+# ``div.news_wrap`` containers are tokenized, in chunks, until enough results
+# have been accepted.
+FEED_CHUNK = 16384
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+
+
+class NewsWrapParser(HTMLParser):
+    """Extracts the fields of ``div.news_wrap`` results without building a tree.
+
+    Mirrors the CSS selectors of ``select_news_wraps``: the first
+    ``a.news_tit, a.api_txt_lines`` is the title, ``div.dsc_wrap,
+    a.api_txt_lines.dsc_txt`` the summary, ``span.info`` the press,
+    ``span.info_group span`` the time and ``div.thumb img`` the image.
+    Finished results accumulate in ``results``. A text node split across
+    ``feed`` calls reaches ``handle_data`` in pieces; they are buffered until
+    the next markup so every captured field holds whole text nodes.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.results: List[Dict[str, Any]] = []
+        # Open elements of the current result: (tag, classes, fields captured by it).
+        self._stack: List[Tuple[str, Set[str], List[str]]] = []
+        self._record: Dict[str, Any] = {}
+        self._text: Dict[str, List[str]] = {}
+        self._pending: List[str] = []
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        self._flush_text()
+        attributes = dict(attrs)
+        classes = set((attributes.get("class") or "").split())
+        if not self._stack:
+            if tag == "div" and "news_wrap" in classes:
+                self._stack.append((tag, classes, []))
+                self._record, self._text = {}, {}
+            return
+
+        if tag == "img":
+            if "image" not in self._record and self._inside("div", "thumb"):
+                self._record["image"] = attributes.get("data-src") or attributes.get("src")
+            return
+        if tag in VOID_TAGS:
+            return
+
+        fields: List[str] = []
+        if tag == "a" and classes & {"news_tit", "api_txt_lines"}:
+            fields.append("title")
+        if (tag == "div" and "dsc_wrap" in classes) or (tag == "a" and {"api_txt_lines", "dsc_txt"} <= classes):
+            fields.append("summary")
+        if tag == "span" and "info" in classes:
+            fields.append("source")
+        if tag == "span" and self._inside("span", "info_group"):
+            fields.append("time")
+        fields = [field for field in fields if field not in self._text]
+        for field in fields:
+            self._text[field] = []
+        if "title" in fields:
+            self._record["link"] = attributes.get("href") or ""
+        self._stack.append((tag, classes, fields))
+
+    def handle_endtag(self, tag: str) -> None:
+        self._flush_text()
+        if not self._stack:
+            return
+        for depth in range(len(self._stack) - 1, -1, -1):
+            if self._stack[depth][0] == tag:
+                del self._stack[depth:]
+                break
+        else:
+            return
+        if not self._stack:
+            record = self._record
+            for field, pieces in self._text.items():
+                record[field] = pieces
+            self.results.append(record)
+
+    def handle_data(self, data: str) -> None:
+        if self._stack:
+            self._pending.append(data)
+
+    def handle_comment(self, data: str) -> None:
+        self._flush_text()
+
+    def close(self) -> None:
+        super().close()
+        self._flush_text()
+
+    def _flush_text(self) -> None:
+        if not self._pending:
+            return
+        node = "".join(self._pending)
+        self._pending.clear()
+        for _, _, fields in self._stack:
+            for field in fields:
+                self._text[field].append(node)
+
+    def _inside(self, tag: str, css_class: str) -> bool:
+        return any(open_tag == tag and css_class in classes for open_tag, classes, _ in self._stack)
+
+
+def iter_news_wraps(html: str) -> Iterator[Dict[str, Any]]:
+    """Raw result records from the targeted tokenizer, produced as the page is fed in."""
+    marker = html.find("news_wrap")
+    if marker < 0:
+        return
+    parser = NewsWrapParser()
+    for offset in range(max(html.rfind("<div", 0, marker), 0), len(html), FEED_CHUNK):
+        parser.feed(html[offset : offset + FEED_CHUNK])
+        yield from parser.results
+        parser.results.clear()
+    parser.close()
+    yield from parser.results
+
+
+def select_news_wraps(html: str) -> Iterator[Dict[str, Any]]:
+    """Raw result records via full parse and CSS selectors; the fallback path."""
+    soup = BeautifulSoup(html, "html.parser")
+    for wrap in soup.select("div.news_wrap"):
+        record: Dict[str, Any] = {}
+        title_el = wrap.select_one("a.news_tit, a.api_txt_lines")
+        if title_el:
+            record["title"] = [title_el.get_text()]
+            record["link"] = title_el.get("href") or ""
+        summary_el = wrap.select_one("div.dsc_wrap, a.api_txt_lines.dsc_txt")
+        if summary_el:
+            record["summary"] = list(summary_el.stripped_strings)
+        source_el = wrap.select_one("span.info")
+        if source_el:
+            record["source"] = [source_el.get_text()]
+        time_el = wrap.select_one("span.info_group span")
+        if time_el:
+            record["time"] = [time_el.get_text()]
+        image_el = wrap.select_one("div.thumb img")
+        if image_el:
+            record["image"] = image_el.get("data-src") or image_el.get("src")
+        yield record
+
+
+def parse_results(html: str, limit: int) -> List[NewsItem]:
+    items, matched = _accept(iter_news_wraps(html), limit)
+    if not matched:
+        # Layout changed under the tokenizer: fall back to the full selector parse.
+        items, _ = _accept(select_news_wraps(html), limit)
     return items
 
 
+def _accept(records: Iterable[Dict[str, Any]], limit: int) -> Tuple[List[NewsItem], int]:
+    items: List[NewsItem] = []
+    matched = 0
+    for record in records:
+        if "title" not in record:
+            continue
+        matched += 1
+        item = _build_item(record)
+        if item is None:
+            continue
+        items.append(item)
+        if len(items) >= limit:
+            break
+    return items, matched
+
+
+def _build_item(record: Dict[str, Any]) -> NewsItem | None:
+    title = clean_text("".join(record["title"]))
+    link = record.get("link") or ""
+    summary_parts = [part.strip() for part in record.get("summary") or [] if part.strip()]
+    summary = summarise_text(" ".join(summary_parts) if "summary" in record else title, 180)
+    source_name = clean_text("".join(record["source"])) if "source" in record else "네이버 뉴스"
+    published_at = parse_relative_time(clean_text("".join(record["time"])) if "time" in record else "")
+    image_url = record.get("image") or config.DEFAULT_IMAGE_URL
+
+    combined = f"{title} {summary}"
+    if is_stock_related(combined):
+        return None
+    if not is_autonomy_related(combined):
+        return None
+
+    return NewsItem(
+        source=f"네이버 - {source_name}" if source_name else "네이버 뉴스",
+        title=title,
+        summary=summary,
+        url=link,
+        published_at=published_at,
+        image_url=image_url,
+        language="ko",
+    )
+
+
 def parse_relative_time(text: str) -> str:
     now = datetime.now(config.KST)
     if not text:
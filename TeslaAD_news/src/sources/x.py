@@ -1,37 +1,111 @@
 from __future__ import annotations
 
+import hashlib
 import logging
 from datetime import datetime, timedelta
-from typing import Iterable, List
+from typing import Any, Dict, Iterator, List, Optional
 
 import requests
 
-from .. import config
+from .. import config, storage
 from ..models import NewsItem
 from ..utils import clean_text, is_autonomy_related, is_stock_related, summarise_text
 
 logger = logging.getLogger(__name__)
 
+X_QUERY = "(Tesla OR 테슬라) (autonomous driving OR Autopilot OR 자율주행 OR FSD OR Robotaxi)"
+WINDOW_DAYS = 2
+# Nitter lists newest first, so a run of already seen posts means the rest is old too.
+STOP_AFTER_SEEN = 5
 
-def fetch_x_snippets(limit: int = 3) -> List[NewsItem]:
-    since_date = (datetime.now(config.KST) - timedelta(days=2)).strftime("%Y-%m-%d")
-    query = "(Tesla OR 테슬라) (autonomous driving OR Autopilot OR 자율주행 OR FSD OR Robotaxi)"
+
+def fetch_x_snippets(limit: int = 3, timeout: float = 20.0, query: str = X_QUERY) -> List[NewsItem]:
+    """Recent X posts for ``query``, fetched incrementally.
+
+    Fingerprints of every post parsed before are kept in ``X_STATE_FILE``
+    together with the posts that were accepted. Only posts with an unknown
+    fingerprint are cleaned and filtered, and parsing stops at the first run of
+    known ones. The search window starts at the last successful fetch instead
+    of two days back, and the proxy response is reused for
+    ``X_CACHE_TTL_SECONDS``.
+    """
+    now = datetime.now(config.KST)
+    state = _load_state()
+    since = _since(state, now)
     endpoint = (
         "https://r.jina.ai/http://nitter.net/search"
-        f"?f=tweets&q={requests.utils.quote(query)}&since={since_date}"
+        f"?f=tweets&q={requests.utils.quote(query)}&since={since.strftime('%Y-%m-%d')}"
     )
+    markdown = _fetch_markdown(query, endpoint, timeout, state, now)
+    if markdown is not None:
+        _collect_new_posts(markdown, state, now)
+        state["cursor"] = now.isoformat()
+    _prune(state, now)
+    try:
+        storage.atomic_write_json(config.X_STATE_FILE, state, encoding="compact")
+    except OSError as exc:
+        logger.warning("Failed to store X state: %s", exc)
+
+    posts = sorted(state["posts"], key=lambda entry: entry["published_at"], reverse=True)
+    return [NewsItem(**entry) for entry in posts[:limit]]
+
+
+def _load_state() -> Dict[str, Any]:
+    try:
+        state = storage.read_json(config.X_STATE_FILE)
+    except (OSError, ValueError):
+        state = {}
+    if not isinstance(state, dict):
+        state = {}
+    state.setdefault("seen", {})
+    state.setdefault("posts", [])
+    return state
+
+
+def _since(state: Dict[str, Any], now: datetime) -> datetime:
+    floor = now - timedelta(days=WINDOW_DAYS)
+    try:
+        cursor = datetime.fromisoformat(state["cursor"])
+    except (KeyError, TypeError, ValueError):
+        return floor
+    return max(cursor, floor)
+
+
+def _fetch_markdown(query: str, endpoint: str, timeout: float, state: Dict[str, Any], now: datetime) -> Optional[str]:
+    # Keyed on the query: the window start moves with the cursor, so the
+    # endpoint of the next fetch differs from the one that was cached.
+    cached = state.get("response") or {}
     try:
-        response = requests.get(endpoint, headers={"User-Agent": config.USER_AGENT}, timeout=20)
+        age = (now - datetime.fromisoformat(cached["fetched_at"])).total_seconds()
+    except (KeyError, TypeError, ValueError):
+        age = None
+    if cached.get("query") == query and age is not None and 0 <= age < config.X_CACHE_TTL_SECONDS:
+        return cached.get("text", "")
+
+    try:
+        response = requests.get(endpoint, headers={"User-Agent": config.USER_AGENT}, timeout=timeout)
         response.raise_for_status()
     except Exception as exc:
         logger.warning("Failed to fetch X snippets: %s", exc)
-        return []
+        return None
+    state["response"] = {"query": query, "fetched_at": now.isoformat(), "text": response.text}
+    return response.text
+
 
-    snippets = _parse_markdown(response.text)
-    posts: List[NewsItem] = []
-    timestamp = datetime.now(config.KST)
+def _collect_new_posts(markdown: str, state: Dict[str, Any], now: datetime) -> None:
+    seen: Dict[str, str] = state["seen"]
+    timestamp = now
+    known_in_a_row = 0
+    for snippet in _iter_posts(markdown):
+        fingerprint = _fingerprint(snippet)
+        if fingerprint in seen:
+            known_in_a_row += 1
+            if known_in_a_row >= STOP_AFTER_SEEN:
+                break
+            continue
+        known_in_a_row = 0
+        seen[fingerprint] = now.isoformat()
 
-    for snippet in snippets:
         combined = clean_text(snippet)
         if is_stock_related(combined):
             continue
@@ -39,32 +113,47 @@ def fetch_x_snippets(limit: int = 3) -> List[NewsItem]:
             continue
         summary = summarise_text(combined, 200)
         title = summarise_text(combined, 80)
-        posts.append(
-            NewsItem(
-                source="X (Nitter)",
-                title=f"X : {title}",
-                summary=summary,
-                url=f"https://nitter.net/search?f=tweets&q={requests.utils.quote(title)}",
-                published_at=timestamp.isoformat(),
-                image_url=config.DEFAULT_IMAGE_URL,
-                language="multi",
-            )
+        state["posts"].append(
+            {
+                "source": "X (Nitter)",
+                "title": f"X : {title}",
+                "summary": summary,
+                "url": f"https://nitter.net/search?f=tweets&q={requests.utils.quote(title)}",
+                "published_at": timestamp.isoformat(),
+                "image_url": config.DEFAULT_IMAGE_URL,
+                "language": "multi",
+            }
         )
         timestamp -= timedelta(minutes=5)
-        if len(posts) >= limit:
-            break
 
-    return posts
 
+def _prune(state: Dict[str, Any], now: datetime) -> None:
+    # Fingerprints outlive the search window by a day so a post at its edge is
+    # not taken for new; both tables are capped regardless of age.
+    seen_cutoff = (now - timedelta(days=WINDOW_DAYS + 1)).isoformat()
+    seen = sorted(
+        ((fingerprint, first_seen) for fingerprint, first_seen in state["seen"].items() if first_seen >= seen_cutoff),
+        key=lambda entry: entry[1],
+    )
+    state["seen"] = dict(seen[-config.X_SEEN_LIMIT:])
+
+    post_cutoff = (now - timedelta(days=WINDOW_DAYS)).isoformat()
+    posts = [entry for entry in state["posts"] if entry.get("published_at", "") >= post_cutoff]
+    posts.sort(key=lambda entry: entry["published_at"])
+    state["posts"] = posts[-config.X_KEPT_POSTS:]
 
-def _parse_markdown(markdown: str) -> List[str]:
-    posts: List[str] = []
+
+def _fingerprint(snippet: str) -> str:
+    return hashlib.sha1(" ".join(snippet.lower().split()).encode("utf-8")).hexdigest()[:16]
+
+
+def _iter_posts(markdown: str) -> Iterator[str]:
     current: List[str] = []
     for raw_line in markdown.splitlines():
         line = raw_line.strip()
         if not line:
             if current:
-                posts.append(" ".join(current))
+                yield " ".join(" ".join(current).split())
                 current = []
             continue
         if line.startswith("Title:") or line.startswith("URL Source:") or line.startswith("Markdown Content:"):
@@ -83,14 +172,4 @@ def _parse_markdown(markdown: str) -> List[str]:
         current.append(line)
 
     if current:
-        posts.append(" ".join(current))
-
-    cleaned: List[str] = []
-    seen = set()
-    for post in posts:
-        normalized = " ".join(post.split())
-        if not normalized or normalized in seen:
-            continue
-        seen.add(normalized)
-        cleaned.append(normalized)
-    return cleaned
+        yield " ".join(" ".join(current).split())
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, List, Optional
+
+from . import config
+
+
+logger = logging.getLogger(__name__)
+
+ENCODINGS = {
+    "json": ".json",
+    "compact": ".json",
+    "gzip": ".json.gz",
+}
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write ``data`` to a temp file next to ``path``, fsync it and rename it into place."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    _fsync_dir(path.parent)
+
+
+def atomic_write_json(path: Path, payload: Any, encoding: str = "json") -> None:
+    atomic_write_bytes(path, encode_payload(payload, encoding))
+
+
+def encode_payload(payload: Any, encoding: str = "json") -> bytes:
+    if encoding == "json":
+        return json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+    compact = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    if encoding == "compact":
+        return compact
+    if encoding == "gzip":
+        # mtime=0 keeps identical payloads byte-identical across runs.
+        return gzip.compress(compact, compresslevel=6, mtime=0)
+    raise ValueError(f"Unknown snapshot encoding: {encoding}")
+
+
+def read_json(path: Path) -> Any:
+    raw = path.read_bytes()
+    if path.suffix == ".gz":
+        raw = gzip.decompress(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+def write_snapshot(payload: dict) -> Path:
+    """Store ``payload`` as a dated version, move the ``latest`` pointer and prune old versions."""
+    encoding = config.SNAPSHOT_ENCODING
+    stamp = _parse_timestamp(payload.get("updated_at"))
+    day_dir = config.SNAPSHOT_DIR / stamp.strftime("%Y-%m-%d")
+    version_path = day_dir / f"news-{stamp.strftime('%H%M%S')}{ENCODINGS[encoding]}"
+
+    atomic_write_json(version_path, payload, encoding)
+    pointer = version_path.relative_to(config.SNAPSHOT_DIR).as_posix()
+    atomic_write_bytes(config.SNAPSHOT_LATEST_FILE, pointer.encode("utf-8"))
+    prune_snapshots(config.SNAPSHOT_RETENTION)
+    return version_path
+
+
+def list_snapshots() -> List[Path]:
+    """Return stored versions, oldest first."""
+    if not config.SNAPSHOT_DIR.exists():
+        return []
+    versions = [
+        path
+        for day_dir in config.SNAPSHOT_DIR.iterdir()
+        if day_dir.is_dir()
+        for path in day_dir.glob("news-*.json*")
+    ]
+    return sorted(versions, key=lambda path: (path.parent.name, path.name))
+
+
+def latest_snapshot_path() -> Optional[Path]:
+    try:
+        pointer = config.SNAPSHOT_LATEST_FILE.read_text(encoding="utf-8").strip()
+    except OSError:
+        pointer = ""
+    if pointer:
+        candidate = config.SNAPSHOT_DIR / pointer
+        if candidate.exists():
+            return candidate
+    versions = list_snapshots()
+    return versions[-1] if versions else None
+
+
+def read_snapshot(day: str | None = None) -> Optional[dict]:
+    """Load the latest snapshot, or the last one stored on ``day`` (``YYYY-MM-DD``)."""
+    if day is None:
+        path = latest_snapshot_path()
+    else:
+        day_dir = config.SNAPSHOT_DIR / day
+        versions = sorted(day_dir.glob("news-*.json*")) if day_dir.is_dir() else []
+        path = versions[-1] if versions else None
+    if path is None:
+        return None
+    try:
+        return read_json(path)
+    except (OSError, ValueError) as exc:
+        logger.warning("Failed to read snapshot %s: %s", path, exc)
+        return None
+
+
+def prune_snapshots(retention: int) -> None:
+    versions = list_snapshots()
+    for path in versions[: max(len(versions) - retention, 0)]:
+        try:
+            path.unlink()
+        except OSError as exc:
+            logger.debug("Failed to remove old snapshot %s: %s", path, exc)
+            continue
+        try:
+            path.parent.rmdir()
+        except OSError:
+            pass  # directory still holds newer versions
+
+
+def _parse_timestamp(value: str | None) -> datetime:
+    try:
+        dt = datetime.fromisoformat(value) if value else datetime.now(config.KST)
+    except ValueError:
+        dt = datetime.now(config.KST)
+    if dt.tzinfo is None:
+        return config.KST.localize(dt)
+    return dt.astimezone(config.KST)
+
+
+def _fsync_dir(path: Path) -> None:
+    if os.name != "posix":
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
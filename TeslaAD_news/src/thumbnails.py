@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+import requests
+
+from . import config, storage
+
+
+logger = logging.getLogger(__name__)
+_index: dict[str, dict[str, Any]] = {}
+_dirty = False
+_loaded = False
+
+
+def _load_index() -> None:
+    global _loaded, _index
+    if _loaded:
+        return
+    if config.THUMBNAIL_INDEX_FILE.exists():
+        try:
+            _index = json.loads(config.THUMBNAIL_INDEX_FILE.read_text(encoding="utf-8"))
+        except Exception:
+            logger.warning("Failed to read thumbnail index, resetting.")
+            _index = {}
+    _loaded = True
+
+
+def persist_index() -> None:
+    global _dirty
+    if _dirty:
+        prune()
+        storage.atomic_write_json(config.THUMBNAIL_INDEX_FILE, _index)
+        _dirty = False
+
+
+def ensure_thumbnails(image_url: Optional[str], timeout: float = 15.0) -> Optional[Dict[str, str]]:
+    """Width -> file name of the local thumbnails for ``image_url``, creating them on first use.
+
+    The source image is downloaded once; later calls are answered from the
+    index without touching the remote host. A failed image is retried at most
+    once a day.
+    """
+    global _dirty
+    if not image_url or not image_url.startswith("http"):
+        return None
+    _load_index()
+    today = datetime.now(config.KST).date().isoformat()
+    entry = _index.get(image_url)
+    if entry is None or (not entry.get("files") and entry.get("failed") != today):
+        files = _create(image_url, timeout)
+        entry = {"files": files} if files else {"files": {}, "failed": today}
+        _index[image_url] = entry
+        _dirty = True
+    if entry.get("used") != today:
+        entry["used"] = today
+        _dirty = True
+    return entry["files"] or None
+
+
+def prune() -> None:
+    """Forget images unused for THUMBNAIL_RETENTION_DAYS and delete files no entry refers to."""
+    global _dirty
+    cutoff = (datetime.now(config.KST) - timedelta(days=config.THUMBNAIL_RETENTION_DAYS)).date().isoformat()
+    for image_url in [url for url, entry in _index.items() if entry.get("used", "") < cutoff]:
+        del _index[image_url]
+        _dirty = True
+    if not config.THUMBNAIL_DIR.exists():
+        return
+    referenced = {name for entry in _index.values() for name in (entry.get("files") or {}).values()}
+    for path in config.THUMBNAIL_DIR.iterdir():
+        if path.is_file() and path.name not in referenced:
+            path.unlink(missing_ok=True)
+
+
+def _create(image_url: str, timeout: float) -> Dict[str, str]:
+    try:
+        from PIL import Image, ImageOps, features
+    except ImportError:
+        logger.warning("Pillow is not installed; skipping thumbnails")
+        return {}
+
+    data = _download(image_url, timeout)
+    if data is None:
+        return {}
+    try:
+        with Image.open(io.BytesIO(data)) as opened:
+            image = ImageOps.exif_transpose(opened)
+            image.load()
+    except Exception as exc:
+        logger.debug("Unreadable image %s: %s", image_url, exc)
+        return {}
+
+    webp = features.check("webp")
+    if image.mode not in ("RGB", "RGBA") or not webp:
+        image = image.convert("RGBA" if webp and "A" in image.getbands() else "RGB")
+
+    files: Dict[str, str] = {}
+    for width in config.THUMBNAIL_WIDTHS:
+        resized = image
+        if image.width > width:
+            resized = image.resize((width, max(round(image.height * width / image.width), 1)), Image.LANCZOS)
+        buffer = io.BytesIO()
+        if webp:
+            resized.save(buffer, "WEBP", quality=config.THUMBNAIL_QUALITY, method=4)
+            extension = "webp"
+        else:
+            resized.save(buffer, "JPEG", quality=config.THUMBNAIL_QUALITY, optimize=True, progressive=True)
+            extension = "jpg"
+        encoded = buffer.getvalue()
+        # Content-hash names never change meaning, so browsers may cache them forever.
+        name = f"{hashlib.sha256(encoded).hexdigest()[:20]}.{extension}"
+        path = config.THUMBNAIL_DIR / name
+        if not path.exists():
+            storage.atomic_write_bytes(path, encoded)
+        files[str(width)] = name
+        if image.width <= width:
+            break  # larger widths would only repeat the original size
+    return files
+
+
+def _download(image_url: str, timeout: float) -> Optional[bytes]:
+    try:
+        with requests.get(
+            image_url,
+            headers={"User-Agent": config.USER_AGENT},
+            timeout=timeout,
+            stream=True,
+        ) as response:
+            response.raise_for_status()
+            if not response.headers.get("Content-Type", "image/").startswith("image/"):
+                return None
+            chunks = []
+            size = 0
+            for chunk in response.iter_content(65536):
+                size += len(chunk)
+                if size > config.THUMBNAIL_MAX_SOURCE_BYTES:
+                    logger.debug("Image too large, skipping: %s", image_url)
+                    return None
+                chunks.append(chunk)
+            return b"".join(chunks)
+    except Exception as exc:
+        logger.debug("Failed to download image %s: %s", image_url, exc)
+        return None
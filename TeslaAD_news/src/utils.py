@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import functools
 import logging
 import re
+from collections import OrderedDict
 from html import unescape
 from typing import Iterable
 
@@ -13,6 +13,13 @@ from . import config
 
 logger = logging.getLogger(__name__)
 TRANSLATE_ENDPOINT = "https://translate.googleapis.com/translate_a/single"
+# A Hangul syllable block carries roughly as much as a short Latin word
+# fragment, so mixed headlines such as "Tesla FSD 베타 확대" count as Korean.
+KOREAN_RATIO_THRESHOLD = 0.3
+TRANSLATE_TIMEOUT = 10.0
+TRANSLATE_CACHE_SIZE = 1024
+
+_translations: OrderedDict[str, str | None] = OrderedDict()
 
 
 def clean_text(value: str) -> str:
@@ -30,20 +37,55 @@ def summarise_text(text: str, limit: int = 160) -> str:
     return text[: limit - 1].rstrip() + "…"
 
 
-def translate_to_korean(text: str) -> str:
+def hangul_ratio(text: str) -> float | None:
+    """Share of Hangul among Hangul + Latin letters, or ``None`` when there are neither."""
+    hangul = latin = 0
+    for ch in text:
+        code = ord(ch)
+        if 0xAC00 <= code <= 0xD7A3 or 0x1100 <= code <= 0x11FF or 0x3130 <= code <= 0x318F:
+            hangul += 1
+        elif ch.isascii() and ch.isalpha():
+            latin += 1
+    total = hangul + latin
+    if not total:
+        return None
+    return hangul / total
+
+
+def needs_translation(text: str) -> bool:
+    ratio = hangul_ratio(text)
+    if ratio is None:
+        # No Hangul or Latin letters: numbers and punctuation stay as they are,
+        # other scripts (kana, CJK ideographs, ...) still go to the translator.
+        return any(ch.isalpha() for ch in text)
+    return ratio < KOREAN_RATIO_THRESHOLD
+
+
+def translate_to_korean(text: str, timeout: float = TRANSLATE_TIMEOUT) -> str:
     text = text.strip()
-    if not text:
+    if not text or not needs_translation(text):
         return text
     try:
-        translated = _translate_cached(text)
+        translated = _translate_cached(text, timeout)
         return translated or text
     except Exception as exc:
         logger.debug("Translation failed: %s", exc)
         return text
 
 
-@functools.lru_cache(maxsize=1024)
-def _translate_cached(text: str) -> str | None:
+def _translate_cached(text: str, timeout: float) -> str | None:
+    # Keyed on the text alone so a deadline-shortened timeout still hits the cache.
+    if text in _translations:
+        _translations.move_to_end(text)
+        return _translations[text]
+    translated = _request_translation(text, timeout)
+    _translations[text] = translated
+    if len(_translations) > TRANSLATE_CACHE_SIZE:
+        _translations.popitem(last=False)
+    return translated
+
+
+def _request_translation(text: str, timeout: float) -> str | None:
     params = {
         "client": "gtx",
         "sl": "auto",
@@ -51,7 +93,7 @@ def _translate_cached(text: str) -> str | None:
         "dt": "t",
         "q": text,
     }
-    response = requests.get(TRANSLATE_ENDPOINT, params=params, timeout=10, headers={"User-Agent": config.USER_AGENT})
+    response = requests.get(TRANSLATE_ENDPOINT, params=params, timeout=timeout, headers={"User-Agent": config.USER_AGENT})
     response.raise_for_status()
     data = response.json()
     translated_segments = [segment[0] for segment in data[0] if segment and segment[0]]
@@ -1,18 +1,31 @@
 import atexit
-import json
 import logging
-from pathlib import Path
-from typing import Any, Dict, List
+import os
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
 
 from apscheduler.schedulers.background import BackgroundScheduler
-from flask import Flask, jsonify, render_template
+from flask import Flask, Response, render_template, request
 
 from fetch_news import DATA_PATH, KST, collect_news, ensure_data_directory, write_news
+from news_cache import Encoded, FileLock, Snapshot, SnapshotCache, placeholder_snapshot
 
 
 logger = logging.getLogger(__name__)
 app = Flask(__name__)
 _scheduler: BackgroundScheduler | None = None
+_snapshots = SnapshotCache(DATA_PATH)
+# Held by whichever worker is refreshing; cold-start requests wait on it,
+# scheduled refreshes skip.
+_refresh_lock = FileLock(DATA_PATH.with_name(f".{DATA_PATH.name}.lock"))
+_placeholder = placeholder_snapshot()
+REFRESH_WAIT_SECONDS = 10.0
+# Every worker runs a scheduler, but only the holder of _leader_lock runs the
+# daily refresh; the OS releases it when the leader exits, and the next poll
+# of another worker takes over.
+_leader_lock = FileLock(DATA_PATH.with_name(".scheduler.lock"))
+LEADER_POLL_SECONDS = 30
+REFRESH_HOUR, REFRESH_MINUTE = 7, 0
 
 
 def _refresh_news() -> Dict[str, Any]:
@@ -22,26 +35,131 @@ def _refresh_news() -> Dict[str, Any]:
     return payload
 
 
-def load_news() -> Dict[str, Any]:
+def _refresh_exclusive(due: Optional[datetime] = None) -> bool:
+    """Refresh under ``_refresh_lock``; False when another worker holds it.
+
+    Every refresh goes through here, so a scheduled or catch-up refresh never
+    overlaps a cold-start one. The snapshot is re-read once the lock is held
+    and only refreshed when it is missing or older than ``due``: the previous
+    holder may have just written it.
+    """
+    with _refresh_lock.hold() as acquired:
+        if acquired:
+            snapshot = _snapshots.get()
+            if snapshot is None:
+                if DATA_PATH.exists():
+                    logger.warning("Cached news file is corrupted; regenerating.")
+                _refresh_news()
+            elif due is not None and snapshot.last_modified < due:
+                logger.info("News snapshot predates the %s refresh; refreshing now", due.strftime("%Y-%m-%d %H:%M"))
+                _refresh_news()
+    return acquired
+
+
+def load_snapshot() -> Snapshot:
+    """Current snapshot, refreshing it when ``news.json`` is missing or corrupt.
+
+    Only the worker that wins ``_refresh_lock`` fetches; the others wait up to
+    REFRESH_WAIT_SECONDS for it to finish and then fall back to the last good
+    snapshot or an empty placeholder instead of fetching themselves.
+    """
     ensure_data_directory()
-    if DATA_PATH.exists():
-        try:
-            return json.loads(DATA_PATH.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
-            logger.warning("Cached news file is corrupted; regenerating.")
-    refreshed = _refresh_news()
-    return refreshed
+    snapshot = _snapshots.get()
+    if snapshot is not None:
+        return snapshot
+
+    if not _refresh_exclusive():
+        logger.info("News refresh running in another worker; waiting for it")
+        with _refresh_lock.hold(timeout=REFRESH_WAIT_SECONDS):
+            pass
+    snapshot = _snapshots.get()
+    if snapshot is None:
+        logger.warning("No news snapshot available yet; serving a fallback")
+        snapshot = _snapshots.stale or _placeholder
+    return snapshot
+
+
+def load_news() -> Dict[str, Any]:
+    return load_snapshot().data
+
+
+def _send_encoded(encoded: Encoded, snapshot: Snapshot, mimetype: str) -> Response:
+    """Serve precomputed bytes, answering a matching ``If-None-Match``/``If-Modified-Since`` with 304."""
+    body, content_encoding, etag = encoded.negotiate(request.accept_encodings)
+    if request.if_none_match:
+        not_modified = any(request.if_none_match.contains_weak(tag) for tag in encoded.etags)
+    else:
+        since = request.if_modified_since
+        not_modified = since is not None and snapshot.last_modified <= since
+    if not_modified:
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype=mimetype)
+        if content_encoding:
+            response.headers["Content-Encoding"] = content_encoding
+    response.set_etag(etag)
+    response.last_modified = snapshot.last_modified
+    response.headers["Vary"] = "Accept-Encoding"
+    response.headers["Cache-Control"] = "no-cache"
+    return response
 
 
 @app.route("/")
 def index():
-    data = load_news()
-    return render_template("index.html", updated_at=data["updated_at"], items=data["items"])
+    snapshot = load_snapshot()
+    page = snapshot.page(
+        "index",
+        lambda: render_template("index.html", updated_at=snapshot.data["updated_at"], items=snapshot.data["items"]),
+    )
+    return _send_encoded(page, snapshot, "text/html")
 
 
 @app.route("/api/news")
 def news():
-    return jsonify(load_news())
+    """Full snapshot, or with ``since=``/``source=``/``limit=`` a filtered or delta view of it."""
+    snapshot = load_snapshot()
+    since = request.args.get("since")
+    sources = request.args.getlist("source")
+    limit = request.args.get("limit", type=int)
+    if not since and not sources and limit is None:
+        return _send_encoded(snapshot.json, snapshot, "application/json")
+
+    view = _snapshots.view(snapshot, since, sources, limit)
+    if view is None:
+        response = Response(status=304)
+        response.set_etag(snapshot.version)
+        response.last_modified = snapshot.last_modified
+        response.headers["Cache-Control"] = "no-cache"
+        return response
+    return _send_encoded(view, snapshot, "application/json")
+
+
+def _poll_leadership() -> None:
+    """Become the refresh leader if no worker is, and pick up a snapshot the leader wrote."""
+    if not _leader_lock.held and _leader_lock.acquire():
+        logger.info("Worker %d is now the news refresh leader", os.getpid())
+        _scheduler.add_job(
+            _scheduled_refresh, trigger="cron", hour=REFRESH_HOUR, minute=REFRESH_MINUTE, id="refresh", replace_existing=True
+        )
+        _scheduled_refresh()
+    _snapshots.get()  # reloads here rather than in the first request after a refresh
+
+
+def _scheduled_refresh() -> None:
+    # Also run when a worker becomes leader: one whose predecessor died around
+    # 07:00 would otherwise leave today's refresh undone until tomorrow.
+    now = datetime.now(KST)
+    due = now.replace(hour=REFRESH_HOUR, minute=REFRESH_MINUTE, second=0, microsecond=0)
+    if due > now:
+        due -= timedelta(days=1)
+    if not _refresh_exclusive(due):
+        logger.info("News refresh already running in another worker; skipping")
+
+
+def _stop_scheduler() -> None:
+    if _scheduler and _scheduler.running:
+        _scheduler.shutdown(wait=False)
+    _leader_lock.release()
 
 
 def _start_scheduler() -> None:
@@ -49,9 +167,11 @@ def _start_scheduler() -> None:
     if _scheduler and _scheduler.running:
         return
     _scheduler = BackgroundScheduler(timezone=KST)
-    _scheduler.add_job(_refresh_news, trigger="cron", hour=7, minute=0)
+    _scheduler.add_job(
+        _poll_leadership, trigger="interval", seconds=LEADER_POLL_SECONDS, next_run_time=datetime.now(KST)
+    )
     _scheduler.start()
-    atexit.register(lambda: _scheduler and _scheduler.shutdown(wait=False))
+    atexit.register(_stop_scheduler)
 
 
 def create_app() -> Flask:
@@ -1,5 +1,7 @@
 import json
 import logging
+import os
+import threading
 from collections import OrderedDict
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta, timezone
@@ -14,6 +16,8 @@ import pytz
 import requests
 from bs4 import BeautifulSoup
 
+from fetch_runner import Call, FetchRunner
+
 
 KST = pytz.timezone("Asia/Seoul")
 PROJECT_ROOT = Path(__file__).resolve().parent
@@ -22,6 +26,8 @@ MAX_ITEMS = 10
 MIN_ITEMS = 5
 MIN_NAVER_ITEMS = 1
 X_SEARCH_WINDOW_DAYS = 2
+# Upper bound on one collect_news run; sources still fetching then are dropped.
+COLLECT_DEADLINE_SECONDS = 45
 
 AUTONOMY_KEYWORDS = [
     "autonomous driving",
@@ -118,9 +124,11 @@ def summarise(text: str, limit: int = 220) -> str:
     return clean[: limit - 1].rstrip() + "…"
 
 
-def fetch_google_news(locale: str, url: str, limit: int = 5, require_autonomy: bool = False) -> List[NewsItem]:
+def fetch_google_news(
+    locale: str, url: str, limit: int = 5, require_autonomy: bool = False, timeout: float = 15
+) -> List[NewsItem]:
     logging.info("Fetching Google News feed: %s", url)
-    response = requests.get(url, headers={"User-Agent": USER_AGENT}, timeout=15)
+    response = requests.get(url, headers={"User-Agent": USER_AGENT}, timeout=timeout)
     response.raise_for_status()
     root = ET.fromstring(response.content)
     items = []
@@ -160,7 +168,7 @@ def parse_pub_date(raw: str) -> datetime:
         return datetime.now(KST)
 
 
-def fetch_naver_news(query: str, limit: int = 5, require_autonomy: bool = False) -> List[NewsItem]:
+def fetch_naver_news(query: str, limit: int = 5, require_autonomy: bool = False, timeout: float = 15) -> List[NewsItem]:
     url = "https://search.naver.com/search.naver"
     params = {"where": "news", "query": query, "sm": "tab_opt"}
     logging.info("Fetching Naver News search page for query: %s", query)
@@ -168,7 +176,7 @@ def fetch_naver_news(query: str, limit: int = 5, require_autonomy: bool = False)
         url,
         params=params,
         headers={"User-Agent": USER_AGENT},
-        timeout=15,
+        timeout=timeout,
     )
     response.raise_for_status()
     soup = BeautifulSoup(response.text, "html.parser")
@@ -287,7 +295,7 @@ def ensure_naver_presence(items: List[NewsItem], naver_candidates: Iterable[News
     return items
 
 
-def fetch_x_posts(limit: int = 3) -> List[NewsItem]:
+def fetch_x_posts(limit: int = 3, timeout: float = 15) -> List[NewsItem]:
     since_date = (datetime.now(KST) - timedelta(days=X_SEARCH_WINDOW_DAYS)).strftime("%Y-%m-%d")
     query = "(Tesla OR 테슬라) (autonomous driving OR Autopilot OR 자율주행 OR FSD)"
     endpoint = (
@@ -295,12 +303,8 @@ def fetch_x_posts(limit: int = 3) -> List[NewsItem]:
         f"?f=tweets&q={quote_plus(query)}&since={since_date}"
     )
     logging.info("Fetching X posts via Nitter bridge: %s", endpoint)
-    try:
-        response = requests.get(endpoint, headers={"User-Agent": USER_AGENT}, timeout=15)
-        response.raise_for_status()
-    except Exception as exc:
-        logging.warning("Failed to fetch X posts: %s", exc)
-        return []
+    response = requests.get(endpoint, headers={"User-Agent": USER_AGENT}, timeout=timeout)
+    response.raise_for_status()
 
     snippets = parse_nitter_markdown(response.text)
     logging.info("Parsed %d X snippets", len(snippets))
@@ -407,7 +411,11 @@ def write_news(items: List[NewsItem]) -> dict:
         "updated_at": datetime.now(KST).isoformat(),
         "items": [asdict(item) for item in items],
     }
-    DATA_PATH.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    # Write then rename, so readers (and the app's snapshot cache, which keys on
+    # mtime/inode) never see a half-written file.
+    tmp_path = DATA_PATH.with_name(f".{DATA_PATH.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    os.replace(tmp_path, DATA_PATH)
     return payload
 
 
@@ -437,29 +445,48 @@ def collect_news() -> List[NewsItem]:
         },
     ]
 
-    collected: List[NewsItem] = []
+    calls = {}
     for feed in google_feeds:
         encoded_query = quote_plus(feed["query"])
         url = (
             f"https://news.google.com/rss/search?q={encoded_query}"
             f"&hl={feed['hl']}&gl={feed['gl']}&ceid={feed['ceid']}"
         )
-        collected.extend(fetch_google_news(feed["locale"], url))
+        calls[f"google-{feed['locale']}"] = Call("news.google.com", fetch_google_news, (feed["locale"], url))
 
     naver_queries = ["테슬라 자율주행", "테슬라 오토파일럿", "테슬라 FSD"]
-    naver_items: List[NewsItem] = []
     for query in naver_queries:
-        naver_items.extend(fetch_naver_news(query, limit=3, require_autonomy=True))
-    if len(naver_items) < MIN_NAVER_ITEMS:
-        backup = fetch_naver_news("테슬라 자율주행", limit=4, require_autonomy=False)
-        for item in backup:
-            if item not in naver_items:
-                naver_items.append(item)
-    naver_site_feed = fetch_google_news(
-        "KR",
-        "https://news.google.com/rss/search?q=site:naver.com+%ED%85%8C%EC%8A%AC%EB%9D%BC+%EC%9E%90%EC%9C%A8%EC%A3%BC%ED%96%89&hl=ko&gl=KR&ceid=KR:ko",
-        require_autonomy=True,
+        calls[f"naver-{query}"] = Call(
+            "search.naver.com", fetch_naver_news, (query,), {"limit": 3, "require_autonomy": True}
+        )
+    calls["naver-site"] = Call(
+        "news.google.com",
+        fetch_google_news,
+        (
+            "KR",
+            "https://news.google.com/rss/search?q=site:naver.com+%ED%85%8C%EC%8A%AC%EB%9D%BC+%EC%9E%90%EC%9C%A8%EC%A3%BC%ED%96%89&hl=ko&gl=KR&ceid=KR:ko",
+        ),
+        {"require_autonomy": True},
     )
+    calls["x"] = Call("r.jina.ai", fetch_x_posts, (), {"limit": 3})
+
+    with FetchRunner(COLLECT_DEADLINE_SECONDS) as runner:
+        results = runner.gather(calls)
+        naver_items: List[NewsItem] = []
+        for query in naver_queries:
+            naver_items.extend(results[f"naver-{query}"])
+        if len(naver_items) < MIN_NAVER_ITEMS:
+            backup = runner.gather(
+                {"naver-backup": Call("search.naver.com", fetch_naver_news, ("테슬라 자율주행",), {"limit": 4})}
+            )["naver-backup"]
+            for item in backup:
+                if item not in naver_items:
+                    naver_items.append(item)
+
+    collected: List[NewsItem] = []
+    for feed in google_feeds:
+        collected.extend(results[f"google-{feed['locale']}"])
+    naver_site_feed = results["naver-site"]
     for item in naver_site_feed:
         item.source = "Naver (via Google)"
     naver_items.extend(naver_site_feed)
@@ -471,8 +498,7 @@ def collect_news() -> List[NewsItem]:
 
     collected.extend(recent_naver_items)
 
-    x_posts = fetch_x_posts(limit=3)
-    collected.extend(x_posts)
+    collected.extend(results["x"])
 
     deduped = deduplicate(collected)
     deduped.sort(key=get_item_datetime, reverse=True)
@@ -0,0 +1,200 @@
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
+
+
+logger = logging.getLogger(__name__)
+
+REQUEST_TIMEOUT_SECONDS = 15.0
+# A second attempt is raced against one that has not answered after this long
+# (or that failed), whichever comes first; the first success wins.
+HEDGE_AFTER_SECONDS = 4.0
+MAX_ATTEMPTS = 2
+BREAKER_FAILURES = 3
+BREAKER_COOLDOWN_SECONDS = 300.0
+
+
+class CircuitBreaker:
+    """Skips a host for BREAKER_COOLDOWN_SECONDS after BREAKER_FAILURES failures in a row.
+
+    After the cool-down the breaker is half-open: a single trial call goes
+    through and every other call is still skipped until it returns. Its
+    failure opens the breaker again, its success closes it.
+    """
+
+    def __init__(self) -> None:
+        self.failures = 0
+        self.open_until = 0.0
+        self.probing = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.failures < BREAKER_FAILURES:
+                return True
+            if self.probing or time.monotonic() < self.open_until:
+                return False
+            self.probing = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.open_until = 0.0
+            self.probing = False
+
+    def record_failure(self) -> bool:
+        """Count a failure; True when it (re)opened the breaker."""
+        with self._lock:
+            self.failures += 1
+            self.probing = False
+            if self.failures >= BREAKER_FAILURES:
+                self.open_until = time.monotonic() + BREAKER_COOLDOWN_SECONDS
+                return True
+            return False
+
+    def record_cancelled(self) -> None:
+        """A call that never ran: let the next one be the trial instead."""
+        with self._lock:
+            self.probing = False
+
+
+# Per host, and per process: a long-running app keeps skipping a dead host
+# across refreshes.
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def breaker_for(host: str) -> CircuitBreaker:
+    with _breakers_lock:
+        return _breakers.setdefault(host, CircuitBreaker())
+
+
+def _record_outcome(host: str, future: Future) -> None:
+    # A done callback, so attempts abandoned at the deadline still count.
+    breaker = breaker_for(host)
+    if future.cancelled():
+        breaker.record_cancelled()
+    elif future.exception() is None:
+        breaker.record_success()
+    elif breaker.record_failure():
+        logger.warning("Circuit opened for %s", host)
+
+
+@dataclass
+class Call:
+    """One fetch: ``fetch(*args, timeout=..., **kwargs)`` returning a list of items."""
+
+    host: str
+    fetch: Callable[..., List[Any]]
+    args: tuple = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class _Progress:
+    call: Call
+    attempts: int = 0
+    started_at: float = 0.0
+    pending: int = 0
+    result: Optional[List[Any]] = None
+    done: bool = False
+
+
+class FetchRunner:
+    """Runs fetches concurrently under one deadline, with hedging and per-host circuit breakers.
+
+    Every call is answered -- with an empty list when its host is skipped, all
+    attempts failed or the deadline passed -- so one bad upstream can neither
+    fail nor stall a collect. Attempts still running at the deadline are
+    abandoned; their request timeout never exceeds the time that was left.
+    """
+
+    def __init__(self, deadline_seconds: float, max_workers: int = 8) -> None:
+        self.deadline = time.monotonic() + deadline_seconds
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fetch")
+
+    def remaining(self) -> float:
+        return max(self.deadline - time.monotonic(), 0.0)
+
+    def gather(self, calls: Dict[str, Call]) -> Dict[str, List[Any]]:
+        progress = {name: _Progress(call) for name, call in calls.items()}
+        attempts: Dict[Future, str] = {}
+
+        def start(name: str) -> None:
+            state = progress[name]
+            if not breaker_for(state.call.host).allow():
+                logger.info("Skipping %s: %s is cooling down after repeated failures", name, state.call.host)
+                state.attempts = MAX_ATTEMPTS
+                if not state.pending:
+                    state.done = True
+                return
+            timeout = min(REQUEST_TIMEOUT_SECONDS, self.remaining())
+            future = self._executor.submit(state.call.fetch, *state.call.args, timeout=timeout, **state.call.kwargs)
+            future.add_done_callback(partial(_record_outcome, state.call.host))
+            attempts[future] = name
+            state.attempts += 1
+            state.pending += 1
+            state.started_at = time.monotonic()
+
+        for name in progress:
+            start(name)
+
+        while attempts and self.remaining() > 0:
+            hedge_at = min(
+                (state.started_at + HEDGE_AFTER_SECONDS for state in progress.values()
+                 if not state.done and state.attempts < MAX_ATTEMPTS),
+                default=self.deadline,
+            )
+            timeout = min(max(hedge_at - time.monotonic(), 0.0), self.remaining())
+            finished, _ = wait(list(attempts), timeout=timeout, return_when=FIRST_COMPLETED)
+
+            for future in finished:
+                name = attempts.pop(future)
+                state = progress[name]
+                state.pending -= 1
+                try:
+                    result = future.result()
+                except Exception as exc:
+                    logger.warning("Fetch %s failed (attempt %d): %s", name, state.attempts, exc)
+                    if state.done:
+                        continue
+                    if state.attempts < MAX_ATTEMPTS:
+                        start(name)
+                    elif not state.pending:
+                        state.done = True
+                    continue
+                if not state.done:
+                    state.result = result
+                    state.done = True
+
+            now = time.monotonic()
+            for name, state in progress.items():
+                if (
+                    not state.done
+                    and state.pending
+                    and state.attempts < MAX_ATTEMPTS
+                    and now - state.started_at >= HEDGE_AFTER_SECONDS
+                ):
+                    logger.info("Hedging slow fetch %s", name)
+                    start(name)
+
+            attempts = {future: name for future, name in attempts.items() if not progress[name].done}
+
+        for name, state in progress.items():
+            if not state.done:
+                logger.warning("Fetch %s missed the collect deadline", name)
+        return {name: state.result or [] for name, state in progress.items()}
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self) -> "FetchRunner":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
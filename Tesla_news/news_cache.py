@@ -0,0 +1,387 @@
+import bisect
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+try:
+    import brotli
+except ImportError:  # optional; without it only gzip and identity bodies are served
+    brotli = None
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+logger = logging.getLogger(__name__)
+# Item fingerprints of this many past snapshots are kept, so ``since=<version>``
+# can be answered with an exact delta.
+HISTORY_VERSIONS = 16
+VIEW_CACHE_SIZE = 64
+# ETags of filtered and delta views are hashes of their own bodies; this many
+# are mapped back to the snapshot version they were cut from.
+VIEW_VERSIONS = HISTORY_VERSIONS * VIEW_CACHE_SIZE
+
+
+@dataclass(frozen=True)
+class Encoded:
+    """One response body, precompressed once, with a strong validator per content coding."""
+
+    identity: bytes
+    gzip: bytes
+    br: Optional[bytes]
+    version: str  # content hash of ``identity``
+
+    def negotiate(self, accept_encoding) -> Tuple[bytes, Optional[str], str]:
+        """Pick body, ``Content-Encoding`` and ETag for a werkzeug ``Accept-Encoding`` header."""
+        if self.br is not None and accept_encoding["br"]:
+            return self.br, "br", f"{self.version}-br"
+        if accept_encoding["gzip"]:
+            return self.gzip, "gzip", f"{self.version}-gz"
+        return self.identity, None, self.version
+
+    @property
+    def etags(self) -> Tuple[str, ...]:
+        return self.version, f"{self.version}-gz", f"{self.version}-br"
+
+
+def encode(body: bytes) -> Encoded:
+    return Encoded(
+        identity=body,
+        gzip=gzip.compress(body, compresslevel=9, mtime=0),
+        br=brotli.compress(body, quality=11) if brotli is not None else None,
+        version=hashlib.sha256(body).hexdigest()[:32],
+    )
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    key: Tuple[int, int, int]  # (mtime_ns, inode, size) of the file it was read from
+    data: Dict[str, Any]
+    json: Encoded
+    last_modified: datetime
+    pages: Dict[str, Encoded] = field(default_factory=dict, compare=False)
+    # Query indexes, built once per snapshot: items per source in payload
+    # order, and all items newest first with their negated timestamps
+    # (ascending, for bisect).
+    by_source: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict, compare=False)
+    by_time: List[Dict[str, Any]] = field(default_factory=list, compare=False)
+    neg_times: List[float] = field(default_factory=list, compare=False)
+    fingerprints: Dict[str, str] = field(default_factory=dict, compare=False)
+    views: Dict[Tuple[Any, ...], Encoded] = field(default_factory=dict, compare=False)
+
+    @property
+    def version(self) -> str:
+        return self.json.version
+
+    def page(self, name: str, render: Callable[[], str]) -> Encoded:
+        """Rendered page ``name`` of this snapshot, rendered and compressed on first use.
+
+        Pages live on the snapshot object, so a reloaded snapshot starts with
+        none and stale HTML can never outlive the data it was rendered from.
+        """
+        encoded = self.pages.get(name)
+        if encoded is None:
+            encoded = encode(render().encode("utf-8"))
+            self.pages[name] = encoded
+        return encoded
+
+
+class _Version(NamedTuple):
+    """What a delta needs to know about an earlier snapshot."""
+
+    updated_at: float
+    fingerprints: Dict[str, str]  # item identity -> content hash
+    sources: Dict[str, str]  # item identity -> source
+
+
+class SnapshotCache:
+    """Parsed ``news.json`` plus its serialised, compressed API bodies.
+
+    ``get`` costs one ``stat`` while the file is unchanged; a new mtime, inode
+    or size (``write_news`` replaces the file atomically) triggers a single
+    reload shared by all threads.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._snapshot: Optional[Snapshot] = None
+        self._lock = threading.Lock()
+        self._history: "OrderedDict[str, _Version]" = OrderedDict()
+        self._view_versions: "OrderedDict[str, str]" = OrderedDict()
+        self._view_lock = threading.Lock()
+
+    def get(self) -> Optional[Snapshot]:
+        snapshot = self._snapshot
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        if snapshot is not None and snapshot.key == _key(stat):
+            return snapshot
+
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is not None and snapshot.key == _key(stat):
+                return snapshot  # another thread reloaded it meanwhile
+            snapshot = self._load()
+            if snapshot is not None:
+                self._snapshot = snapshot
+                self._history[snapshot.version] = _Version(
+                    updated_at=_timestamp(snapshot.data.get("updated_at")),
+                    fingerprints=snapshot.fingerprints,
+                    sources={_item_key(item)[0]: item.get("source", "") for item in snapshot.data["items"]},
+                )
+                self._history.move_to_end(snapshot.version)
+                while len(self._history) > HISTORY_VERSIONS:
+                    self._history.popitem(last=False)
+            return snapshot
+
+    def invalidate(self) -> None:
+        self._snapshot = None
+
+    @property
+    def stale(self) -> Optional[Snapshot]:
+        """Last snapshot that loaded successfully, even if the file has since gone bad."""
+        return self._snapshot
+
+    def view(
+        self, snapshot: Snapshot, since: Optional[str], sources: Sequence[str], limit: Optional[int]
+    ) -> Optional[Encoded]:
+        """Filtered or delta body of ``snapshot``; None when nothing changed ``since``.
+
+        ``since`` is either a version (the ETag or ``version`` field of an
+        earlier ``/api/news`` response, filtered and delta ones included) or an
+        ISO timestamp. A known version, or the ``updated_at``
+        of a known snapshot, yields exactly the items that are new or changed
+        since then plus the URLs that were dropped. Any other timestamp only
+        yields the items *published* after it, which misses older articles
+        collected later and says nothing about removals. An unknown version
+        yields everything.
+        """
+        since_time, since_version = _parse_since(since, snapshot)
+        if since_version is not None:
+            since_version = self._view_versions.get(since_version, since_version)
+        if since_time is not None:
+            for version, known in self._history.items():
+                if known.updated_at == since_time:
+                    since_time, since_version = None, version
+                    break
+        if since_version == snapshot.version:
+            return None
+        if since_time is not None and since_time >= _timestamp(snapshot.data.get("updated_at")):
+            return None
+
+        cache_key = (since_time, since_version, tuple(sources), limit)
+        encoded = snapshot.views.get(cache_key)
+        if encoded is not None:
+            self._remember_view(encoded, snapshot)
+            return encoded
+
+        known = self._history.get(since_version) if since_version else None
+        previous = known.fingerprints if known is not None else None
+        if since_time is not None:
+            items = snapshot.by_time[: bisect.bisect_left(snapshot.neg_times, -since_time)]
+        elif previous is not None:
+            items = []
+            for item in snapshot.data["items"]:
+                identity, content = _item_key(item)
+                if previous.get(identity) != content:
+                    items.append(item)
+        else:
+            items = snapshot.data["items"]
+        if sources:
+            wanted = set(sources)
+            if since_time is None and previous is None:
+                items = [item for source in sources for item in snapshot.by_source.get(source, ())]
+            else:
+                items = [item for item in items if item.get("source") in wanted]
+        if limit is not None:
+            items = items[: max(limit, 0)]
+
+        payload: Dict[str, Any] = {
+            "updated_at": snapshot.data.get("updated_at"),
+            "version": snapshot.version,
+            "delta": since_time is not None or previous is not None,
+            "items": items,
+        }
+        if previous is not None:
+            removed = previous.keys() - snapshot.fingerprints.keys()
+            if sources:
+                removed = {identity for identity in removed if known.sources.get(identity) in wanted}
+            payload["removed"] = sorted(removed)
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        encoded = encode(body)
+        if len(snapshot.views) >= VIEW_CACHE_SIZE:
+            snapshot.views.clear()
+        snapshot.views[cache_key] = encoded
+        self._remember_view(encoded, snapshot)
+        return encoded
+
+    def _remember_view(self, encoded: Encoded, snapshot: Snapshot) -> None:
+        with self._view_lock:
+            self._view_versions[encoded.version] = snapshot.version
+            self._view_versions.move_to_end(encoded.version)
+            while len(self._view_versions) > VIEW_VERSIONS:
+                self._view_versions.popitem(last=False)
+
+    def _load(self) -> Optional[Snapshot]:
+        try:
+            with open(self.path, "rb") as handle:
+                stat = os.fstat(handle.fileno())
+                raw = handle.read()
+            data = json.loads(raw)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.warning("Cannot read news snapshot %s: %s", self.path, exc)
+            return None
+        return _build(_key(stat), data, datetime.fromtimestamp(int(stat.st_mtime), tz=timezone.utc))
+
+
+def placeholder_snapshot() -> Snapshot:
+    """Empty snapshot served while no worker has produced ``news.json`` yet."""
+    return _build((0, 0, 0), {"updated_at": None, "items": []}, datetime.now(timezone.utc))
+
+
+def _build(key: Tuple[int, int, int], data: Dict[str, Any], last_modified: datetime) -> Snapshot:
+    items = data.get("items") or []
+    by_source: Dict[str, List[Dict[str, Any]]] = {}
+    for item in items:
+        by_source.setdefault(item.get("source", ""), []).append(item)
+    timed = sorted(((_timestamp(item.get("published_at")), item) for item in items), key=lambda entry: -entry[0])
+    body = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return Snapshot(
+        key=key,
+        data=data,
+        json=encode(body),
+        last_modified=last_modified,
+        by_source=by_source,
+        by_time=[item for _, item in timed],
+        neg_times=[-stamp for stamp, _ in timed],
+        fingerprints=dict(_item_key(item) for item in items),
+    )
+
+
+def _item_key(item: Dict[str, Any]) -> Tuple[str, str]:
+    """(identity, content hash) of an item; the identity is its URL, as in ``deduplicate``."""
+    content = json.dumps(item, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    return item.get("url") or item.get("title", ""), hashlib.sha1(content).hexdigest()[:16]
+
+
+def _timestamp(value: Optional[str]) -> float:
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _parse_since(raw: Optional[str], snapshot: Snapshot) -> Tuple[Optional[float], Optional[str]]:
+    """(timestamp, None) or (None, version) for a ``since`` parameter."""
+    if not raw:
+        return None, None
+    value = raw.strip()
+    if value.startswith("W/"):
+        value = value[2:]
+    value = value.strip('"')
+    try:
+        # An unescaped "+09:00" arrives as " 09:00" in a query string.
+        moment = datetime.fromisoformat(value.replace(" ", "+"))
+    except ValueError:
+        for suffix in ("-gz", "-br"):
+            value = value.removesuffix(suffix)
+        return None, value
+    if moment.tzinfo is None:
+        try:
+            moment = moment.replace(tzinfo=datetime.fromisoformat(snapshot.data["updated_at"]).tzinfo)
+        except (KeyError, TypeError, ValueError):
+            moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp(), None
+
+
+class FileLock:
+    """Exclusive lock on ``path`` shared by every process on the host.
+
+    Backed by ``flock`` (``msvcrt.locking`` on Windows), so the OS drops it when
+    the holder exits or crashes and no stale lock file has to be cleaned up.
+    A ``threading.Lock`` taken first makes one instance exclusive between the
+    threads of its process too; it is not reentrant.
+    """
+
+    POLL_SECONDS = 0.2
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._handle = None
+        self._thread_lock = threading.Lock()
+
+    @property
+    def held(self) -> bool:
+        return self._handle is not None
+
+    def acquire(self, timeout: float = 0.0) -> bool:
+        """Try to take the lock, waiting for at most ``timeout`` seconds."""
+        deadline = time.monotonic() + timeout
+        if not self._thread_lock.acquire(timeout=max(timeout, 0.0)):
+            return False
+        try:
+            handle = open(self.path, "a+b")
+        except OSError:
+            self._thread_lock.release()
+            raise
+        while True:
+            try:
+                if fcntl is not None:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                else:
+                    handle.seek(0)
+                    msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+            except OSError:
+                if time.monotonic() >= deadline:
+                    handle.close()
+                    self._thread_lock.release()
+                    return False
+                time.sleep(self.POLL_SECONDS)
+                continue
+            self._handle = handle
+            return True
+
+    def release(self) -> None:
+        handle, self._handle = self._handle, None
+        if handle is None:
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            handle.close()
+            self._thread_lock.release()
+
+    @contextmanager
+    def hold(self, timeout: float = 0.0) -> Iterator[bool]:
+        """``with lock.hold() as acquired:`` -- released on exit if it was acquired."""
+        acquired = self.acquire(timeout)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                self.release()
+
+
+def _key(stat: os.stat_result) -> Tuple[int, int, int]:
+    return stat.st_mtime_ns, stat.st_ino, stat.st_size